@@ -5,7 +5,7 @@ A user-friendly interface for the PokeMMO sprite replacement pipeline.
 """
 
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox, scrolledtext
+from tkinter import ttk, filedialog, messagebox, scrolledtext, font as tkfont
 import threading
 import logging
 import time
@@ -14,13 +14,38 @@ from pathlib import Path
 import json
 import re
 import queue
+from collections import deque, namedtuple
 from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import gc
 import os
+import sys
 
 # Import the core processing functionality
 from mod_packager import ModPackager
 
+# Mousewheel sequences for this platform (X11 reports the wheel as buttons 4/5)
+_WHEEL_EVENTS = ("<Button-4>", "<Button-5>") if sys.platform.startswith('linux') else ("<MouseWheel>",)
+
+# Leading dex number of a sprite filename, used to sort and label fixes
+_DEX_RE = re.compile(r'^(\d{3,4})')
+
+# A 'dex-type-variant[-gender].gif' sprite filename, parsed once when the analysis results come in
+ParsedName = namedtuple('ParsedName', 'dex sprite_type variant gender filename is_fixable')
+
+
+def _parse_sprite_name(filename, is_fixable):
+    """Split a sprite filename into a ParsedName; missing parts read as "unknown" like the issue rows show them"""
+    parts = filename.split('-')
+    try:
+        dex = int(parts[0])
+    except ValueError:
+        dex = 9999
+    sprite_type = parts[1] if len(parts) > 1 else "unknown"
+    variant = parts[2].replace('.gif', '') if len(parts) > 2 else "unknown"
+    gender = parts[3].replace('.gif', '') if len(parts) > 3 else ""
+    return ParsedName(dex, sprite_type, variant, gender, filename, is_fixable)
+
 
 class SpriteConverterGUI:
     """
@@ -49,6 +74,89 @@ class SpriteConverterGUI:
         preview_cache (dict): Cache for processed preview images
     """
     
+    # Operation priority used to order applied fixes and prevent dependency issues
+    _OPERATION_PRIORITY = {
+        'clone': 1,                           # Create files first
+        'create_gender_variant': 2,           # Create gender variants from base files
+        'create_gender_variant_from_other': 2, # Create gender variants from other gender
+        'create_base_from_male': 2,           # Create base files from male variants
+        'create_base_from_female': 2,         # Create base files from female variants
+        'replacement': 3,                     # Create variants from base files
+        'rename': 4,                          # Fix naming issues
+        'retain_extra': 5,                    # Keep extra files
+        'remove_base': 6,                     # Remove conflicting base files
+        'remove': 7,                          # Remove files last
+        'cleanup': 8                          # Final cleanup operations
+    }
+    
+    # Display name and color for each recommendation action
+    _ACTION_MAPPING = {
+        'rename': ('RENAME', '#f39c12'),
+        'remove': ('REMOVE', '#e74c3c'),
+        'cleanup': ('CLEANUP', '#e74c3c'),
+        'create_gender_variant': ('CREATE GENDER VARIANT', '#3498db'),
+        'create_gender_variant_from_other': ('CREATE GENDER VARIANT', '#3498db'),
+        'create_base_from_male': ('CREATE BASE', '#9b59b6'),
+        'create_base_from_female': ('CREATE BASE', '#9b59b6'),
+        'clone': ('CLONE', '#2ecc71'),
+        'replacement': ('REPLACEMENT', '#1abc9c'),
+        'retain_extra': ('RETAIN EXTRA', '#34495e'),
+        'remove_base': ('REMOVE BASE', '#e67e22')
+    }
+    
+    # Icon shown on each recommendation card, per action
+    _ACTION_ICONS = {
+        'replacement': '🔄',
+        'rename': '📝',
+        'remove': '🗑️',
+        'cleanup': '🧹',
+        'remove_base': '🗑️',
+        'create_gender_variant': '👥',
+        'create_gender_variant_from_other': '👥',
+        'create_gender_variant_with_cleanup': '👥🧹',
+        'create_base_from_male': '📄',
+        'create_base_from_female': '📄',
+        'create_base_with_cleanup': '📄🧹',
+        'clone': '📋',
+        'comprehensive_replacement': '🔧',
+        'retain_extra': '💾'
+    }
+    
+    # Actions shown under another operation type's section in the Fixes tab
+    _OPERATION_GROUP_ALIASES = {
+        'create_gender_variant_from_other': 'create_gender_variant',
+        'create_base_from_male': 'create_base',
+        'create_base_from_female': 'create_base'
+    }
+    
+    # Section color and icon per (grouped) operation type in the Fixes tab
+    _SECTION_COLORS = {
+        'replacement': ('#27ae60', '🔄'),
+        'rename': ('#3498db', '📝'),
+        'remove': ('#e74c3c', '🗑️'),
+        'cleanup': ('#e74c3c', '🧹'),
+        'remove_base': ('#e74c3c', '🗑️'),
+        'create_gender_variant': ('#3498db', '👥'),
+        'create_base': ('#9b59b6', '📄'),
+        'clone': ('#9b59b6', '📋'),
+        'comprehensive_replacement': ('#f39c12', '🔧'),
+        'retain_extra': ('#34495e', '💾')
+    }
+    
+    # Conversion a fixable (non-rename) file needs, keyed on whether it is a gender variant
+    _FIXABLE_ISSUE_DESCRIPTIONS = {
+        True: ("Gender variant needs base file (Bullseye requires base file, not gender variants)", "🔄"),
+        False: ("Base file needs gender variants (Bullseye requires male/female variants)", "👥")
+    }
+    
+    # Fixed cell geometry for the virtualized issues grid
+    _ISSUE_ROW_HEIGHT = 88
+    _ISSUE_COLUMNS = 2
+    _ISSUE_PAD_X = 20
+    
+    # Most units one coalesced wheel flush may scroll, so trackpad flicks can't jump screens
+    _MAX_WHEEL_UNITS = 8
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Bullseye Injector v1.0")
@@ -86,6 +194,19 @@ class SpriteConverterGUI:
         self.initial_setup = True  # Flag to prevent directory change detection during setup
         self.analysis_running = False  # Flag to track if file analysis is currently running
         self.file_detection_complete = False  # Flag to track if file detection has completed
+        self._refresh_token = 0  # Bumped per scheduled refresh so only the latest one runs
+        self._settings_io = ThreadPoolExecutor(max_workers=1)  # One worker keeps settings writes in order
+        self._issue_desc_short = {}  # full description -> single-line truncated form
+        
+        # Mousewheel is routed through one global handler to the canvas registered
+        # for the widget under the pointer (path name -> canvas)
+        self._scroll_targets = {}
+        # Wheel ticks accumulate here and are applied at most once per ~16 ms frame
+        self._pending_scroll = 0
+        self._scroll_canvas = None
+        self._scroll_after = None
+        for sequence in _WHEEL_EVENTS:
+            self.root.bind_all(sequence, self._global_mousewheel)
         
         # Preview state
         self.preview_label = None
@@ -1127,6 +1248,36 @@ class SpriteConverterGUI:
         analysis_thread = threading.Thread(target=self.detect_files, daemon=True)
         analysis_thread.start()
     
+    def _schedule_refresh(self, delay=500):
+        """Debounce refresh_analysis so back-to-back requests coalesce into one scan"""
+        self._refresh_token += 1
+        self.root.after(delay, lambda token=self._refresh_token: self._maybe_refresh(token))
+    
+    def _maybe_refresh(self, token):
+        """Run a scheduled refresh only if no newer one was requested in the meantime"""
+        if token != self._refresh_token:
+            return
+        self.refresh_analysis()
+    
+    def _set_unfulfilled_files(self, unfulfilled_files):
+        """Store the unfulfilled files and presort the parsed per-tab front/back lists by dex number"""
+        parsed_files = sorted((_parse_sprite_name(filename, is_fixable) 
+                               for filename, is_fixable in unfulfilled_files.items()), 
+                              key=lambda parsed: parsed.dex)
+        self._sorted_front_files = [p for p in parsed_files if '-front-' in p.filename]
+        self._sorted_back_files = [p for p in parsed_files if '-back-' in p.filename]
+        self.unfulfilled_files = unfulfilled_files
+    
+    def _set_current_recommendations(self, recommendations):
+        """Store the recommendations and index rename sources by target filename"""
+        rename_by_to = {}
+        for rec in recommendations:
+            if rec.get('action') == 'rename':
+                # First rename wins, matching the order the recommendations are listed in
+                rename_by_to.setdefault(rec.get('to'), rec.get('from', 'unknown'))
+        self._rename_by_to = rename_by_to
+        self.current_recommendations = recommendations
+    
     def detect_files(self):
         """
         Detect and validate sprite files in all directories with comprehensive error handling.
@@ -1296,7 +1447,7 @@ class SpriteConverterGUI:
                 self.current_back_file_matches = set()  # Initialize empty set
                 
                 # Store recommendations
-                self.current_recommendations = all_recommendations
+                self._set_current_recommendations(all_recommendations)
                 
                 # Calculate back files fulfillment - simple and direct approach
                 # 1. Take all front files that bullseye needs
@@ -1331,7 +1482,7 @@ class SpriteConverterGUI:
                 
                 
                 # Create unfulfilled_files data structure for the Issues tabs
-                self.unfulfilled_files = {}
+                unfulfilled_files = {}
                 
                 # Method 1: Get unfulfilled files from recommendations (these are definitely unfulfilled and fixable)
                 for rec in self.current_recommendations:
@@ -1339,15 +1490,15 @@ class SpriteConverterGUI:
                     if isinstance(rec.get('to'), list):
                         # For operations that create multiple files
                         for target_file in rec['to']:
-                            if target_file not in self.unfulfilled_files:
-                                self.unfulfilled_files[target_file] = True  # Fixable
+                            if target_file not in unfulfilled_files:
+                                unfulfilled_files[target_file] = True  # Fixable
                                 if '403-front-s.gif' in target_file:
                                     pass  # Debug check removed
                     elif rec.get('to'):
                         # For operations that create a single file
                         target_file = rec['to']
-                        if target_file not in self.unfulfilled_files:
-                            self.unfulfilled_files[target_file] = True  # Fixable
+                        if target_file not in unfulfilled_files:
+                            unfulfilled_files[target_file] = True  # Fixable
                             if '403-front-s.gif' in target_file:
                                 pass  # Debug check removed
                 
@@ -1358,19 +1509,21 @@ class SpriteConverterGUI:
                 if hasattr(self, 'current_unfulfilled_back_files'):
                     for back_file in self.current_unfulfilled_back_files:
                         # Skip if already found in recommendations or bullseye files
-                        if back_file not in self.unfulfilled_files:
-                            self.unfulfilled_files[back_file] = False  # Not fixable
+                        if back_file not in unfulfilled_files:
+                            unfulfilled_files[back_file] = False  # Not fixable
                 else:
                     pass  # No current_unfulfilled_back_files attribute found
                 
                 # Method 4: Add unfulfilled files from analysis (files that cannot be fulfilled)
                 if hasattr(self, 'unfulfilled_files_from_analysis'):
                     for unfulfilled_file in self.unfulfilled_files_from_analysis:
-                        if unfulfilled_file not in self.unfulfilled_files:
-                            self.unfulfilled_files[unfulfilled_file] = False  # Not fixable
+                        if unfulfilled_file not in unfulfilled_files:
+                            unfulfilled_files[unfulfilled_file] = False  # Not fixable
                 else:
                     pass  # No unfulfilled_files_from_analysis attribute found
                 
+                self._set_unfulfilled_files(unfulfilled_files)
+                
             
             # Check for missing required directories
             self.check_missing_directories(bullseye_dir, replacement_dir, output_dir)
@@ -3261,10 +3414,8 @@ class SpriteConverterGUI:
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
-        # Bind mousewheel to canvas
-        def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        # Route mousewheel over the dialog to its canvas
+        self._scroll_targets[str(dialog)] = canvas
         
         # Create Pokemon entries grid
         pokemon_entries = {}
@@ -3350,13 +3501,9 @@ class SpriteConverterGUI:
                         return
             
             result[0] = overrides
-            # Unbind mousewheel before destroying
-            canvas.unbind_all("<MouseWheel>")
             dialog.destroy()
         
         def on_cancel():
-            # Unbind mousewheel before destroying
-            canvas.unbind_all("<MouseWheel>")
             dialog.destroy()
         
         # Buttons on bottom right
@@ -3379,10 +3526,10 @@ class SpriteConverterGUI:
         # Bind Escape key
         dialog.bind('<Escape>', lambda e: on_cancel())
         
-        # Clean up mousewheel binding when dialog is destroyed
+        # Stop routing mousewheel to the canvas when dialog is destroyed
         def cleanup_on_destroy(event):
             if event.widget == dialog:
-                canvas.unbind_all("<MouseWheel>")
+                self._scroll_targets.pop(str(dialog), None)
         dialog.bind('<Destroy>', cleanup_on_destroy)
         
         dialog.wait_window()
@@ -4114,7 +4261,7 @@ class SpriteConverterGUI:
     
     def multi_step_resize(self, image, target_size):
         """Resize image using multiple steps for better quality on large scale factors"""
-        from PIL import Image
+        from sprite_processor import pick_resample
         
         current = image
         current_size = current.size
@@ -4125,13 +4272,7 @@ class SpriteConverterGUI:
         
         # For small scale factors, use smart resampling
         if scale_factor <= 1.5:
-            # Use smart resampling: NEAREST for integer scaling, LANCZOS for non-integer
-            scale_x = target_size[0] / current.width
-            scale_y = target_size[1] / current.height
-            if scale_x == int(scale_x) and scale_y == int(scale_y) and scale_x >= 1.0 and scale_y >= 1.0:
-                return current.resize(target_size, Image.Resampling.NEAREST)
-            else:
-                return current.resize(target_size, Image.Resampling.LANCZOS)
+            return current.resize(target_size, pick_resample(current.size, target_size))
         
         # For large scale factors, use multiple steps with LANCZOS for smoother results
         steps = []
@@ -4146,13 +4287,7 @@ class SpriteConverterGUI:
         for step_scale in steps:
             new_width = int(current_size[0] * step_scale)
             new_height = int(current_size[1] * step_scale)
-            # Use smart resampling: NEAREST for integer scaling, LANCZOS for non-integer
-            scale_x = new_width / current_size[0]
-            scale_y = new_height / current_size[1]
-            if scale_x == int(scale_x) and scale_y == int(scale_y) and scale_x >= 1.0 and scale_y >= 1.0:
-                current = current.resize((new_width, new_height), Image.Resampling.NEAREST)
-            else:
-                current = current.resize((new_width, new_height), Image.Resampling.LANCZOS)
+            current = current.resize((new_width, new_height), pick_resample(current_size, (new_width, new_height)))
             current_size = current.size
         
         return current
@@ -4239,29 +4374,21 @@ class SpriteConverterGUI:
         applied_count = 0
         failed_count = 0
         
-        # Define operation priority to prevent dependency issues
-        operation_priority = {
-            'clone': 1,                           # Create files first
-            'create_gender_variant': 2,           # Create gender variants from base files
-            'create_gender_variant_from_other': 2, # Create gender variants from other gender
-            'create_base_from_male': 2,           # Create base files from male variants
-            'create_base_from_female': 2,         # Create base files from female variants
-            'replacement': 3,                     # Create variants from base files
-            'rename': 4,                          # Fix naming issues
-            'retain_extra': 5,                    # Keep extra files
-            'remove_base': 6,                     # Remove conflicting base files
-            'remove': 7,                          # Remove files last
-            'cleanup': 8                          # Final cleanup operations
-        }
-        
-        # Get selected recommendations and sort by priority
-        selected_recommendations = []
-        for i, (rec, var) in enumerate(zip(self.current_recommendations, self.recommendation_vars)):
-            if var.get():  # If checkbox is selected
-                selected_recommendations.append(rec)
+        # Collect selected recommendations tier by tier; the tiers were grouped by
+        # operation priority (in generated order) when the Fixes tab was built,
+        # so no sort is needed here
+        recs_by_priority = getattr(self, '_recs_by_priority', {})
+        unchecked = getattr(self, '_fix_unchecked', set())
+        selected_recommendations = [
+            rec
+            for priority in sorted(recs_by_priority)
+            for rec, iid in recs_by_priority[priority]
+            if iid not in unchecked  # If checkbox is selected
+        ]
         
-        # Sort by operation priority to prevent cascading failures
-        selected_recommendations.sort(key=lambda x: operation_priority.get(x['action'], 999))
+        # Unlinks are independent syscalls, so cleanup recs share one small worker pool,
+        # started on the first cleanup and shut down after the last operation
+        cleanup_pool = None
         
         # Apply operations in priority order
         # Starting to apply selected recommendations
@@ -4285,6 +4412,15 @@ class SpriteConverterGUI:
                     target_path = sprite_dir / rec['to']
                     # Processing rename operation
                     
+                    # Case sensitivity fix whose correctly-named target already exists as a
+                    # separate file needs no operation. Checked here so earlier tiers are
+                    # accounted for; samefile() keeps a case-insensitive file system from
+                    # mistaking the source itself for the target.
+                    if ('case sensitivity' in rec.get('reason', '') and target_path.exists()
+                            and not source_path.samefile(target_path)):
+                        applied_count += 1
+                        continue
+                    
                     # Check actual filenames in directory to handle case sensitivity properly
                     actual_files = [f.name for f in sprite_dir.iterdir() if f.is_file()]
                     source_exists = rec['from'] in actual_files
@@ -4480,12 +4616,10 @@ class SpriteConverterGUI:
                 elif rec['action'] == 'cleanup':
                     # Handle consolidated cleanup operation
                     cleanup_files = rec.get('cleanup_files', [rec['from']])
-                    files_removed = 0
-                    for cleanup_file in cleanup_files:
-                        cleanup_path = sprite_dir / cleanup_file
-                        if cleanup_path.exists():
-                            cleanup_path.unlink()
-                            files_removed += 1
+                    if cleanup_pool is None:
+                        cleanup_pool = ThreadPoolExecutor(max_workers=8)
+                    files_removed = sum(cleanup_pool.map(self._try_unlink,
+                                                         [sprite_dir / f for f in cleanup_files]))
                     if files_removed > 0:
                         applied_count += 1
                         self.log_message(f"Cleaned up {files_removed} files", "INFO")
@@ -4506,6 +4640,9 @@ class SpriteConverterGUI:
                 import traceback
                 self.log_message(f"   Traceback: {traceback.format_exc()}", "ERROR")
         
+        if cleanup_pool is not None:
+            cleanup_pool.shutdown()
+        
         # Close popup
         popup.destroy()
         
@@ -4517,17 +4654,26 @@ class SpriteConverterGUI:
             
             # Clear cached recommendations so next "Fix Issues" shows fresh data
             if hasattr(self, 'current_recommendations'):
-                self.current_recommendations = []
+                self._set_current_recommendations([])
             
             # Re-run file detection to show updated results with background threading
-            self.root.after(500, self.refresh_analysis)
+            self._schedule_refresh()
         else:
             messagebox.showinfo("No Operations", "No file operations were applied.")
     
+    @staticmethod
+    def _try_unlink(path):
+        """Delete a file, returning 1 if it was removed or 0 if it was already gone"""
+        try:
+            path.unlink()
+            return 1
+        except FileNotFoundError:
+            return 0
+    
     def show_unfulfilled_files(self):
         """Show comprehensive issues popup with three tabs: Front Issues, Back Issues, and Fixes"""
-        # Immediately reset button state to prevent white background lag
-        self.root.after_idle(lambda: self.unfulfilled_button.config(state='normal', bg='#e74c3c'))
+        # Reset button state once, up front, to prevent white background lag
+        self.unfulfilled_button.config(state='normal', bg='#e74c3c')
         
         # Check if analysis is still running
         current_status = self.status_var.get()
@@ -4546,9 +4692,6 @@ class SpriteConverterGUI:
         popup.transient(self.root)
         popup.grab_set()
         
-        # Ensure button returns to normal state after popup is created
-        self.root.after_idle(lambda: self.unfulfilled_button.config(state='normal', bg='#e74c3c'))
-        
         # Reset button state when popup is closed
         def on_closing():
             self.unfulfilled_button.config(state='normal', bg='#e74c3c')
@@ -4675,21 +4818,17 @@ class SpriteConverterGUI:
                                    font=("Segoe UI", 14), 
                                    bg='#3a3a3a', fg='#e0e0e0')
             loading_label.pack(pady=50)
-            self.root.update()
             
-            # Populate the tab in a separate thread to avoid blocking UI
+            # Populate once the loading indicator has had an idle pass to render
             def populate_tab():
-                # Populate the tab
                 if tab_key == "back":
-                    self.root.after(0, lambda: self._populate_back_issues_tab(self.issues_tabs[tab_key]))
+                    self._populate_back_issues_tab(self.issues_tabs[tab_key])
                 elif tab_key == "fixes":
-                    self.root.after(0, lambda: self._populate_fixes_tab(self.issues_tabs[tab_key]))
-                
-                # Mark as populated
-                self.tabs_populated[tab_key] = True
+                    self._populate_fixes_tab(self.issues_tabs[tab_key])
             
-            # Run population in background thread
-            threading.Thread(target=populate_tab, daemon=True).start()
+            # Mark as populated so repeated tab switches don't queue it twice
+            self.tabs_populated[tab_key] = True
+            self.root.after_idle(populate_tab)
     
     def preload_issues_tabs(self):
         """Preload all issues tab content in background to avoid lag on first access"""
@@ -4716,101 +4855,24 @@ class SpriteConverterGUI:
         # Run preloading in background thread
         threading.Thread(target=preload_in_background, daemon=True).start()
     
-    def _expand_cleanup_files(self, cleanup_files, expand_frame):
-        """Expand the cleanup files list to show all files"""
-        # Clear the expand button
-        for widget in expand_frame.winfo_children():
-            widget.destroy()
-        
-        # Show all remaining files (skip first 4 since they're already shown)
-        remaining_files = cleanup_files[4:]
-        files_per_line = 2
-        
-        for i in range(0, len(remaining_files), files_per_line):
-            line_files = remaining_files[i:i + files_per_line]
-            cleanup_text = " • ".join(line_files)
-            cleanup_label = tk.Label(expand_frame, text=cleanup_text, 
-                                   font=("Consolas", 8), 
-                                   bg='#2a2a2a', fg='#e74c3c')
-            cleanup_label.pack(anchor=tk.W, pady=0)
-            
-            # Bind mousewheel events to the labels for scrolling
-            if hasattr(self, '_fixes_canvas') and self._fixes_canvas:
-                cleanup_label.bind("<MouseWheel>", lambda e: self._fixes_canvas.yview_scroll(int(-1*(e.delta/120)), "units"))
-                cleanup_label.bind("<Button-4>", lambda e: self._fixes_canvas.yview_scroll(int(-1*(120/120)), "units"))
-                cleanup_label.bind("<Button-5>", lambda e: self._fixes_canvas.yview_scroll(int(-1*(-120/120)), "units"))
-        
-        # Add collapse button
-        collapse_button = tk.Button(expand_frame, 
-                                  text="Show less...", 
-                                  command=lambda: self._collapse_cleanup_files(cleanup_files, expand_frame),
-                                  font=("Consolas", 7), 
-                                  bg='#e74c3c', fg='white',
-                                  relief='flat', bd=0,
-                                  padx=5, pady=2)
-        collapse_button.pack(anchor=tk.W, pady=2)
-        
-        # Bind mousewheel events to the collapse button for scrolling
-        if hasattr(self, '_fixes_canvas') and self._fixes_canvas:
-            collapse_button.bind("<MouseWheel>", lambda e: self._fixes_canvas.yview_scroll(int(-1*(e.delta/120)), "units"))
-            collapse_button.bind("<Button-4>", lambda e: self._fixes_canvas.yview_scroll(int(-1*(120/120)), "units"))
-            collapse_button.bind("<Button-5>", lambda e: self._fixes_canvas.yview_scroll(int(-1*(-120/120)), "units"))
-    
-    def _collapse_cleanup_files(self, cleanup_files, expand_frame):
-        """Collapse the cleanup files list back to showing only 4 files"""
-        # Clear all widgets in the expand frame
-        for widget in expand_frame.winfo_children():
-            widget.destroy()
-        
-        # Re-add the expand button
-        expand_button = tk.Button(expand_frame, 
-                                text="Show all files", 
-                                command=lambda f=cleanup_files, ef=expand_frame: self._expand_cleanup_files(f, ef),
-                                font=("Consolas", 7), 
-                                bg='#e74c3c', fg='white',
-                                relief='flat', bd=0,
-                                padx=5, pady=2)
-        expand_button.pack(side=tk.LEFT)
-        
-        # Bind mousewheel events to the expand button for scrolling
-        if hasattr(self, '_fixes_canvas') and self._fixes_canvas:
-            expand_button.bind("<MouseWheel>", lambda e: self._fixes_canvas.yview_scroll(int(-1*(e.delta/120)), "units"))
-            expand_button.bind("<Button-4>", lambda e: self._fixes_canvas.yview_scroll(int(-1*(120/120)), "units"))
-            expand_button.bind("<Button-5>", lambda e: self._fixes_canvas.yview_scroll(int(-1*(-120/120)), "units"))
-
     def _get_action_display_info(self, action):
         """Get display name and color for an action type"""
-        action_mapping = {
-            'rename': ('RENAME', '#f39c12'),
-            'remove': ('REMOVE', '#e74c3c'),
-            'cleanup': ('CLEANUP', '#e74c3c'),
-            'create_gender_variant': ('CREATE GENDER VARIANT', '#3498db'),
-            'create_gender_variant_from_other': ('CREATE GENDER VARIANT', '#3498db'),
-            'create_base_from_male': ('CREATE BASE', '#9b59b6'),
-            'create_base_from_female': ('CREATE BASE', '#9b59b6'),
-            'clone': ('CLONE', '#2ecc71'),
-            'replacement': ('REPLACEMENT', '#1abc9c'),
-            'retain_extra': ('RETAIN EXTRA', '#34495e'),
-            'remove_base': ('REMOVE BASE', '#e67e22')
-        }
-        
-        display_name, color = action_mapping.get(action, (action.replace('_', ' ').upper(), '#95a5a6'))
-        return display_name, color
+        info = self._ACTION_MAPPING.get(action)
+        if info is None:
+            info = (action.replace('_', ' ').upper(), '#95a5a6')
+        return info
     
-    def _get_issue_description(self, filename, is_fixable):
-        """Get a detailed description of what the issue is for a given filename"""
-        # Parse filename components
-        parts = filename.split('-')
-        if len(parts) < 3:
+    def _get_issue_description(self, parsed):
+        """Get a detailed description of what the issue is for a parsed filename"""
+        # Fewer than three dash-separated parts
+        if parsed.filename.count('-') < 2:
             return "Malformed filename", "⚠️"
         
-        dex_num = parts[0]
-        sprite_type = parts[1]
-        variant = parts[2].replace('.gif', '')
-        gender = parts[3].replace('.gif', '') if len(parts) > 3 else ""
+        filename = parsed.filename
+        gender = parsed.gender
         
         # Check if this file is completely missing (not fixable)
-        if not is_fixable:
+        if not parsed.is_fixable:
             if gender:
                 # Missing gender variant - no source file available
                 return f"File completely missing - no source file available to create this variant", "❌"
@@ -4820,258 +4882,402 @@ class SpriteConverterGUI:
         
         # For fixable files, check if this is a simple rename operation
         # Look for the source file in the recommendations
-        if hasattr(self, 'current_recommendations'):
-            for rec in self.current_recommendations:
-                if rec.get('to') == filename and rec.get('action') == 'rename':
-                    return f"File needs to be renamed from {rec.get('from', 'unknown')}", "📝"
+        source = getattr(self, '_rename_by_to', {}).get(filename)
+        if source is not None:
+            return f"File needs to be renamed from {source}", "📝"
         
-        # For other fixable files, determine the specific conversion needed
-        if sprite_type == "front":
-            if gender:
-                # This is a gender variant that needs to be converted to base
-                if variant == "n":
-                    return f"Gender variant needs base file (Bullseye requires base file, not gender variants)", "🔄"
-                else:
-                    return f"Gender variant needs base file (Bullseye requires base file, not gender variants)", "🔄"
-            else:
-                # This is a base file that might need gender variants
-                if variant == "n":
-                    return f"Base file needs gender variants (Bullseye requires male/female variants)", "👥"
-                else:
-                    return f"Base file needs gender variants (Bullseye requires male/female variants)", "👥"
-        else:  # back
-            if gender:
-                # This is a gender variant that needs to be converted to base
-                if variant == "n":
-                    return f"Gender variant needs base file (Bullseye requires base file, not gender variants)", "🔄"
-                else:
-                    return f"Gender variant needs base file (Bullseye requires base file, not gender variants)", "🔄"
-            else:
-                # This is a base file that might need gender variants
-                if variant == "n":
-                    return f"Base file needs gender variants (Bullseye requires male/female variants)", "👥"
-                else:
-                    return f"Base file needs gender variants (Bullseye requires male/female variants)", "👥"
+        # Front and back, normal and shiny all need the same conversion
+        return self._FIXABLE_ISSUE_DESCRIPTIONS[bool(gender)]
 
     def _populate_front_issues_tab(self, parent):
         """Populate the Front Issues tab with consolidated view for better performance"""
+        self._populate_issues_tab(parent, "front", getattr(self, '_sorted_front_files', []))
+    
+    def _populate_issues_tab(self, parent, sprite_type, files):
+        """Populate a Front/Back Issues tab from its presorted list of ParsedName entries"""
+        widgets = self._create_issues_tab_widgets(parent, sprite_type)
+        canvas = widgets['canvas']
+        
+        if not files:
+            canvas._issue_message = canvas.create_window(0, 50, window=widgets['no_issues_label'], anchor="n")
+            self._layout_issues_canvas(canvas)
+            return
+        
+        # Separate fixable and non-fixable files
+        fixable_files = [f for f in files if f.is_fixable]
+        non_fixable_files = [f for f in files if not f.is_fixable]
+        
+        # Show fixable files individually (these are usually few and important)
+        if fixable_files:
+            fixable_label = widgets['fixable_label']
+            fixable_label.configure(text=f"🔧 Fixable Issues ({len(fixable_files)})")
+            canvas._issue_header = (canvas.create_window(0, 0, window=fixable_label, anchor="nw"), fixable_label)
+            canvas._issue_grid['files'] = fixable_files
+        
+        # Show non-fixable files in consolidated view
+        if non_fixable_files:
+            consolidated_frame = widgets['consolidated_frame']
+            self._create_consolidated_non_fixable_view(consolidated_frame, non_fixable_files, sprite_type, canvas)
+            canvas._issue_footer = (canvas.create_window(0, 0, window=consolidated_frame, anchor="nw"), consolidated_frame)
+        
+        self._layout_issues_canvas(canvas)
+    
+    def _create_issues_tab_widgets(self, parent, sprite_type):
+        """
+        Build the scroll canvas and section widgets of an issues tab.
+        
+        Sections and issue rows are canvas window items at canvas coordinates (see
+        _layout_issues_canvas), so no single widget has to be as tall as the whole list;
+        Tk window geometry is 16-bit and would wrap for long lists.
+        """
         # Clear any existing content first
         for widget in parent.winfo_children():
             widget.destroy()
         
-        # Get all unfulfilled files from the analysis
-        if not hasattr(self, 'unfulfilled_files') or not self.unfulfilled_files:
-            no_issues_label = tk.Label(parent, text="✅ No front file issues found!", 
-                                     font=("Segoe UI", 14), 
-                                     bg='#3a3a3a', fg='#27ae60')
-            no_issues_label.pack(pady=50)
-            return
-        
-        # Create scrollable list structure ONLY when there are issues
+        # Create scrollable list structure
         canvas = tk.Canvas(parent, bg='#3a3a3a', highlightthickness=0)
         scrollbar = tk.Scrollbar(parent, orient="vertical", command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg='#3a3a3a')
+        canvas._issue_message = None  # window item of the "no issues" label
+        canvas._issue_header = None  # (window item, widget) above the grid
+        canvas._issue_footer = None  # (window item, widget) below the grid
+        # Virtualized grid of fixable files: only visible rows get (pooled) widgets
+        canvas._issue_grid = {'files': [], 'top': 0, 'pool': [], 'visible_range': None}
         
-        def update_scroll_region(event=None):
-            # Get the bounding box of all items
-            bbox = canvas.bbox("all")
-            if bbox:
-                # Ensure we have a minimum height to prevent scrolling above content
-                min_height = max(bbox[3] - bbox[1], canvas.winfo_height())
-                canvas.configure(scrollregion=(0, 0, bbox[2], min_height))
-            else:
-                # If no content, set scroll region to canvas size
-                canvas.configure(scrollregion=(0, 0, canvas.winfo_width(), canvas.winfo_height()))
+        # Re-stack the sections when the width changes and re-render rows as the view moves
+        canvas.bind("<Configure>", lambda e: self._layout_issues_canvas(canvas))
+        canvas.configure(yscrollcommand=lambda first, last: self._on_issues_canvas_scroll(canvas, scrollbar, first, last))
         
-        scrollable_frame.bind("<Configure>", update_scroll_region)
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        # Bind mousewheel to canvas for better scrolling
-        def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-        
-        canvas.bind("<MouseWheel>", _on_mousewheel)
-        canvas.bind("<Button-4>", lambda e: _on_mousewheel(type('Event', (), {'delta': 120})()))
-        canvas.bind("<Button-5>", lambda e: _on_mousewheel(type('Event', (), {'delta': -120})()))
+        # Route mousewheel anywhere in this tab to its canvas
+        self._scroll_targets[str(parent)] = canvas
         
         # Pack canvas and scrollbar
         canvas.pack(side="left", fill="both", expand=True, padx=(20, 0), pady=20)
         scrollbar.pack(side="right", fill="y", padx=(0, 20), pady=20)
         
-        # Store current canvas for issue items to bind mousewheel events
-        self._front_issues_canvas = canvas
-        
-        # Collect all front files from unfulfilled_files
-        front_files = []
-        for filename, is_fixable in self.unfulfilled_files.items():
-            if '-front-' in filename:
-                front_files.append((filename, is_fixable))
-        
-        # Sort by dex number (lowest first)
-        def extract_dex_num(filename):
-            parts = filename.split('-')
-            try:
-                return int(parts[0])
-            except (ValueError, IndexError):
-                return 9999
-        
-        front_files.sort(key=lambda x: extract_dex_num(x[0]))
-        
-        if not front_files:
-            no_issues_label = tk.Label(scrollable_frame, text="✅ No front file issues found!", 
-                                     font=("Segoe UI", 14), 
-                                     bg='#3a3a3a', fg='#27ae60')
-            no_issues_label.pack(pady=50)
-        else:
-            # Separate fixable and non-fixable files
-            fixable_files = [f for f in front_files if f[1]]
-            non_fixable_files = [f for f in front_files if not f[1]]
-            
-            # Create main container
-            main_frame = tk.Frame(scrollable_frame, bg='#3a3a3a')
-            main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
-            
-            # Bind mousewheel to main frame
-            main_frame.bind("<MouseWheel>", lambda e: canvas.yview_scroll(int(-1*(e.delta/120)), "units"))
-            main_frame.bind("<Button-4>", lambda e: canvas.yview_scroll(int(-1*(120/120)), "units"))
-            main_frame.bind("<Button-5>", lambda e: canvas.yview_scroll(int(-1*(-120/120)), "units"))
-            
-            # Show fixable files individually (these are usually few and important)
-            if fixable_files:
-                fixable_label = tk.Label(main_frame, text=f"🔧 Fixable Issues ({len(fixable_files)})", 
-                                       font=("Segoe UI", 16, "bold"), 
-                                       bg='#3a3a3a', fg='#27ae60')
-                fixable_label.pack(anchor=tk.W, pady=(0, 10))
-                
-                # Create grid for fixable files
-                fixable_grid = tk.Frame(main_frame, bg='#3a3a3a')
-                fixable_grid.pack(fill=tk.X, pady=(0, 20))
-                fixable_grid.grid_columnconfigure(0, weight=1)
-                fixable_grid.grid_columnconfigure(1, weight=1)
-                
-                # Bind mousewheel to the grid frame for scrolling in empty spaces
-                def bind_grid_mousewheel(event):
-                    canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-                fixable_grid.bind("<MouseWheel>", bind_grid_mousewheel)
-                fixable_grid.bind("<Button-4>", lambda e: bind_grid_mousewheel(type('Event', (), {'delta': 120})()))
-                fixable_grid.bind("<Button-5>", lambda e: bind_grid_mousewheel(type('Event', (), {'delta': -120})()))
-                
-                for i, (filename, is_fixable) in enumerate(fixable_files):
-                    self._create_simple_issue_item(fixable_grid, filename, is_fixable, i, canvas)
-            
-            # Show non-fixable files in consolidated view
-            if non_fixable_files:
-                self._create_consolidated_non_fixable_view(main_frame, non_fixable_files, "front", canvas)
+        no_issues_label = tk.Label(canvas, text=f"✅ No {sprite_type} file issues found!", 
+                                 font=("Segoe UI", 14), 
+                                 bg='#3a3a3a', fg='#27ae60')
+        fixable_label = tk.Label(canvas, 
+                               font=("Segoe UI", 16, "bold"), 
+                               bg='#3a3a3a', fg='#27ae60')
+        consolidated_frame = tk.Frame(canvas, bg='#3a3a3a')
+        
+        # Their heights are only known once Tk has laid them out (or a file list is toggled)
+        fixable_label.bind("<Configure>", lambda e: self._layout_issues_canvas(canvas))
+        consolidated_frame.bind("<Configure>", lambda e: self._layout_issues_canvas(canvas))
+        
+        return {
+            'canvas': canvas,
+            'no_issues_label': no_issues_label,
+            'fixable_label': fixable_label,
+            'consolidated_frame': consolidated_frame,
+        }
+    
+    def _layout_issues_canvas(self, canvas):
+        """Stack header, grid and footer at canvas y-coordinates and set the scroll region to match"""
+        if not canvas.winfo_exists():
+            return
+        width = canvas.winfo_width()
+        pad_x = self._ISSUE_PAD_X
+        
+        if canvas._issue_message is not None:
+            canvas.coords(canvas._issue_message, width // 2, 50)
+        
+        y = 10
+        if canvas._issue_header is not None:
+            item, widget = canvas._issue_header
+            canvas.coords(item, pad_x, y)
+            y += widget.winfo_reqheight() + 10
+        
+        grid = canvas._issue_grid
+        total_rows = (len(grid['files']) + self._ISSUE_COLUMNS - 1) // self._ISSUE_COLUMNS
+        grid['top'] = y
+        if total_rows:
+            y += total_rows * self._ISSUE_ROW_HEIGHT + 20
+        
+        if canvas._issue_footer is not None:
+            item, widget = canvas._issue_footer
+            canvas.coords(item, pad_x, y)
+            canvas.itemconfigure(item, width=max(1, width - 2 * pad_x))
+            y += widget.winfo_reqheight() + 10
+        
+        # Computed, not measured: keep at least a viewport so the view can't scroll above content
+        canvas.configure(scrollregion=(0, 0, width, max(y, canvas.winfo_height())))
+        self._render_visible_issue_rows(canvas)
+    
+    def _global_mousewheel(self, event):
+        """Scroll the registered canvas that contains the widget under the pointer"""
+        widget = event.widget
+        if not isinstance(widget, tk.Misc):
+            return
+        widget_class = widget.winfo_class()
+        if widget_class == 'Scrollbar':
+            return  # Scrollbars already scroll their target natively
+        if widget_class in ('Text', 'Listbox', 'Treeview') and widget.yview() != (0.0, 1.0):
+            return  # Let widgets with their own overflow scroll themselves
+        
+        path = str(widget)
+        while path:
+            canvas = self._scroll_targets.get(path)
+            if canvas is not None:
+                if not canvas.winfo_exists():
+                    self._scroll_targets.pop(path, None)
+                    return
+                # Button-4/5 have a fixed direction, so only <MouseWheel> needs the delta math
+                if event.num == 4:
+                    units = -1
+                elif event.num == 5:
+                    units = 1
+                else:
+                    units = int(-1*(event.delta/120))
+                if canvas is not self._scroll_canvas:
+                    self._flush_scroll()
+                    self._scroll_canvas = canvas
+                self._pending_scroll += units
+                if self._scroll_after is None:
+                    self._scroll_after = self.root.after(16, self._flush_scroll)
+                return
+            path = path.rpartition('.')[0]
+    
+    def _flush_scroll(self):
+        """Apply the wheel units accumulated since the last frame in one yview_scroll"""
+        if self._scroll_after is not None:
+            self.root.after_cancel(self._scroll_after)
+            self._scroll_after = None
+        units, canvas = self._pending_scroll, self._scroll_canvas
+        self._pending_scroll = 0
+        units = max(-self._MAX_WHEEL_UNITS, min(self._MAX_WHEEL_UNITS, units))
+        if units and canvas is not None and canvas.winfo_exists():
+            canvas.yview_scroll(units, "units")
+    
+    def _on_issues_canvas_scroll(self, canvas, scrollbar, first, last):
+        """Update the scrollbar and render the rows that scrolled into view"""
+        scrollbar.set(first, last)
+        self._render_visible_issue_rows(canvas)
+    
+    def _render_visible_issue_rows(self, canvas):
+        """
+        Show pooled row widgets over the grid cells that intersect the canvas viewport.
         
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        Each pooled row is a canvas window item that is moved to its cell's canvas
+        coordinates and re-bound, so the widget count stays proportional to the
+        viewport instead of the number of files.
+        """
+        if not canvas.winfo_exists():
+            return
+        grid = canvas._issue_grid
+        files = grid['files']
+        row_height = self._ISSUE_ROW_HEIGHT
+        columns = self._ISSUE_COLUMNS
+        total_rows = (len(files) + columns - 1) // columns
+        width = canvas.winfo_width()
+        
+        # Viewport expressed relative to the top of the grid
+        view_top = int(canvas.canvasy(0)) - grid['top']
+        view_bottom = view_top + canvas.winfo_height()
+        first_row = min(total_rows, max(0, view_top // row_height))
+        last_row = min(total_rows, max(first_row, view_bottom // row_height + 1))
+        
+        visible_range = (first_row, last_row, width, grid['top'])
+        if visible_range == grid['visible_range']:
+            return
+        grid['visible_range'] = visible_range
+        
+        first = first_row * columns
+        last = min(len(files), last_row * columns)
+        pool = grid['pool']  # [(row canvas, window item)]
+        while len(pool) < last - first:
+            row_canvas = self._create_issue_row(canvas)
+            pool.append((row_canvas, canvas.create_window(0, 0, window=row_canvas, anchor="nw", state="hidden")))
+        
+        pad_x = self._ISSUE_PAD_X
+        col_width = max(17, (width - 2 * pad_x) // columns)
+        for slot, index in enumerate(range(first, last)):
+            row_canvas, item = pool[slot]
+            self._bind_issue_row(row_canvas, files[index], col_width - 16)
+            row, col = divmod(index, columns)
+            canvas.coords(item, pad_x + col * col_width + 8, grid['top'] + row * row_height + 6)
+            canvas.itemconfigure(item, width=col_width - 16, height=row_height - 12, state="normal")
+        
+        # Hide pooled rows that are not needed for the current viewport
+        for _, item in pool[last - first:]:
+            canvas.itemconfigure(item, state="hidden")
+    
+    def _issue_row_fonts(self):
+        """Fonts shared by every canvas-drawn issue row, created on first use"""
+        if not hasattr(self, '_issue_fonts'):
+            self._issue_fonts = {
+                'filename': tkfont.Font(family="Consolas", size=13, weight="bold"),
+                'tag': tkfont.Font(family="Segoe UI", size=6, weight="bold"),
+                'status': tkfont.Font(family="Segoe UI", size=10, weight="bold"),
+                'desc': tkfont.Font(family="Segoe UI", size=10),
+            }
+            self._issue_text_widths = {}
+            # Every badge shares the width of the longest tag text
+            self._issue_tag_width = self._issue_fonts['tag'].measure("FEMALE") + 8
+        return self._issue_fonts
+    
+    def _measure_issue_text(self, font_key, text):
+        """Pixel width of text in one of the issue row fonts (cached per text)"""
+        key = (font_key, text)
+        width = self._issue_text_widths.get(key)
+        if width is None:
+            width = self._issue_text_widths[key] = self._issue_row_fonts()[font_key].measure(text)
+        return width
     
-    def _create_simple_issue_item(self, grid_frame, filename, is_fixable, index, canvas=None):
-        """Create a simple, lightweight issue item for better performance"""
+    def _create_issue_row(self, canvas):
+        """Create an empty, reusable issue row canvas; _bind_issue_row draws its content"""
+        fonts = self._issue_row_fonts()
+        
+        # One canvas per row; text and badges are canvas items instead of child widgets
+        row_canvas = tk.Canvas(canvas, bg='#2a2a2a', highlightthickness=0, 
+                               relief=tk.RAISED, bd=1)
+        row_canvas._bound = None
+        
+        create_text = row_canvas.create_text
+        create_rectangle = row_canvas.create_rectangle
+        items = {'filename': create_text(10, 8, anchor=tk.NW, font=fonts['filename'], fill='#f8f9fa')}
+        
+        # Sprite type, variant and (optional) gender badges: background rectangle + text.
+        # They share the "badges" tag so one move() re-positions them after the filename.
+        tag_width = self._issue_tag_width
+        for slot, badge in enumerate(('type', 'variant', 'gender')):
+            x = slot * (tag_width + 2)
+            items[badge] = (create_rectangle(x, 12, x + tag_width, 26, width=0, tags=('badges',)),
+                            create_text(x + tag_width / 2, 19, font=fonts['tag'], fill='#ffffff', 
+                                        tags=('badges',)))
+        row_canvas._badge_x = 0
+        
+        # Status badge pinned to the right edge (moved as a unit via the "status" tag)
+        items['status_bg'] = create_rectangle(0, 8, 0, 30, width=0, tags=('status',))
+        items['status'] = create_text(0, 19, font=fonts['status'], fill='#ffffff', tags=('status',))
+        row_canvas._status_right = 0
+        
+        # Issue description on second line, kept to one line; truncated text shows in full on hover
+        items['desc'] = create_text(10, 40, anchor=tk.NW, font=fonts['desc'])
+        row_canvas._full_desc = None
+        row_canvas.tag_bind(items['desc'], '<Enter>', lambda e: self._show_issue_tooltip(row_canvas, e))
+        row_canvas.tag_bind(items['desc'], '<Leave>', self._hide_issue_tooltip)
+        row_canvas._items = items
+        row_canvas._item_state = {}  # item id -> last options sent to Tk
+        return row_canvas
+    
+    def _bind_issue_row(self, row_canvas, parsed, width):
+        """Show a file's issue in a pooled row, sending Tk only the item options that changed"""
+        if row_canvas._bound == (parsed, width):
+            return
+        row_canvas._bound = (parsed, width)
+        
         # Determine colors and icons based on fixability
-        if is_fixable:
+        if parsed.is_fixable:
             emoji = '🔧'
             status_text = 'FIXABLE'
             status_color = '#27ae60'
-            bg_color = '#2a2a2a'
             icon_color = '#2ecc71'
         else:
             emoji = '❌'
             status_text = 'NOT FIXABLE'
             status_color = '#e74c3c'
-            bg_color = '#2a2a2a'
             icon_color = '#e67e22'
         
-        # Parse filename for better display
-        parts = filename.split('-')
-        dex_num = parts[0] if len(parts) > 0 else "000"
-        sprite_type = parts[1] if len(parts) > 1 else "unknown"
-        variant = parts[2].replace('.gif', '') if len(parts) > 2 else "unknown"
-        gender = parts[3].replace('.gif', '') if len(parts) > 3 else ""
+        filename = parsed.filename
+        sprite_type = parsed.sprite_type
+        variant = parsed.variant
+        gender = parsed.gender
         
         # Get specific issue description
-        issue_desc, issue_emoji = self._get_issue_description(filename, is_fixable)
-        
-        # Create main file frame with minimal styling
-        file_frame = tk.Frame(grid_frame, bg=bg_color, relief=tk.RAISED, bd=1)
-        row = index // 2
-        col = index % 2
-        file_frame.grid(row=row, column=col, padx=8, pady=6, sticky="ew")
+        issue_desc, issue_emoji = self._get_issue_description(parsed)
         
-        # Top-left layout - everything in one compact area
-        content_frame = tk.Frame(file_frame, bg=bg_color)
-        content_frame.pack(fill=tk.X, padx=10, pady=8, anchor=tk.W)
+        items = row_canvas._items
+        item_state = row_canvas._item_state
+        itemconfigure = row_canvas.itemconfigure
         
-        # Left side: Filename with badges
-        left_frame = tk.Frame(content_frame, bg=bg_color)
-        left_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        def update(item, **options):
+            # Neighbouring rows mostly share badges and status, so skip no-op reconfigures
+            if item_state.get(item) != options:
+                item_state[item] = options
+                itemconfigure(item, **options)
         
-        # Filename with bolded Pokemon number
-        filename_label = tk.Label(left_frame, text=filename, 
-                                font=("Consolas", 13, "bold"), 
-                                bg=bg_color, fg='#f8f9fa')
-        filename_label.pack(side=tk.LEFT, padx=(0, 5))
+        update(items['filename'], text=filename)
         
-        # Small badges right next to filename
-        tags_frame = tk.Frame(left_frame, bg=bg_color)
-        tags_frame.pack(side=tk.LEFT, padx=(0, 10))
+        # Badges sit right after the measured filename
+        badge_x = 15 + self._measure_issue_text('filename', filename)
+        if badge_x != row_canvas._badge_x:
+            row_canvas.move('badges', badge_x - row_canvas._badge_x, 0)
+            row_canvas._badge_x = badge_x
         
-        # Sprite type tag (smaller)
         type_colors = {'front': '#3498db', 'back': '#e74c3c'}
-        type_text = sprite_type.upper()
-        type_tag = tk.Label(tags_frame, text=type_text, 
-                           font=("Segoe UI", 6, "bold"), 
-                           bg=type_colors.get(sprite_type.lower(), '#95a5a6'), 
-                           fg='#ffffff', padx=2, pady=1, width=6)
-        type_tag.pack(side=tk.LEFT, padx=(0, 2))
-        
-        # Variant tag (smaller)
         variant_colors = {'n': '#27ae60', 's': '#f39c12'}
-        variant_text = 'NORMAL' if variant.lower() == 'n' else 'SHINY'
-        variant_tag = tk.Label(tags_frame, text=variant_text, 
-                              font=("Segoe UI", 6, "bold"), 
-                              bg=variant_colors.get(variant.lower(), '#95a5a6'), 
-                              fg='#ffffff', padx=2, pady=1, width=6)
-        variant_tag.pack(side=tk.LEFT, padx=(0, 2))
-        
-        # Gender tag (if present, smaller)
-        if gender:
-            gender_colors = {'m': '#9b59b6', 'f': '#e91e63'}
-            gender_text = 'MALE' if gender.lower() == 'm' else 'FEMALE'
-            gender_tag = tk.Label(tags_frame, text=gender_text, 
-                                 font=("Segoe UI", 6, "bold"), 
-                                 bg=gender_colors.get(gender.lower(), '#95a5a6'), 
-                                 fg='#ffffff', padx=2, pady=1, width=6)
-            gender_tag.pack(side=tk.LEFT, padx=(0, 2))
-        
-        # Right side: Status badge pushed to far right
-        status_label = tk.Label(content_frame, text=f"{emoji} {status_text}", 
-                              font=("Segoe UI", 10, "bold"), 
-                              bg=status_color, fg='#ffffff')
-        status_label.pack(side=tk.RIGHT, anchor=tk.E)
-        
-        # Issue description on second line
-        desc_label = tk.Label(file_frame, text=f"{issue_emoji} {issue_desc}", 
-                            font=("Segoe UI", 10), 
-                            bg=bg_color, fg=icon_color, wraplength=350)
-        desc_label.pack(fill=tk.X, padx=10, pady=(0, 8), anchor=tk.W)
-        
-        # Bind mousewheel to this widget and all its children for scrolling
-        def bind_mousewheel_recursive(widget):
-            """Recursively bind mousewheel to widget and all its children"""
-            target_canvas = canvas or getattr(self, '_front_issues_canvas', None)
-            if target_canvas:
-                def _on_mousewheel(event):
-                    target_canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-                widget.bind("<MouseWheel>", _on_mousewheel)
-                widget.bind("<Button-4>", lambda e: _on_mousewheel(type('Event', (), {'delta': 120})()))
-                widget.bind("<Button-5>", lambda e: _on_mousewheel(type('Event', (), {'delta': -120})()))
-                for child in widget.winfo_children():
-                    bind_mousewheel_recursive(child)
-        
-        bind_mousewheel_recursive(file_frame)
+        gender_colors = {'m': '#9b59b6', 'f': '#e91e63'}
+        badges = {
+            'type': (sprite_type.upper(), type_colors.get(sprite_type.lower(), '#95a5a6')),
+            'variant': ('NORMAL' if variant.lower() == 'n' else 'SHINY', 
+                        variant_colors.get(variant.lower(), '#95a5a6')),
+            'gender': (('MALE' if gender.lower() == 'm' else 'FEMALE', 
+                        gender_colors.get(gender.lower(), '#95a5a6')) if gender else None),
+        }
+        for badge, content in badges.items():
+            rect_id, text_id = items[badge]
+            if content is None:
+                update(rect_id, state='hidden')
+                update(text_id, state='hidden')
+                continue
+            text, color = content
+            update(rect_id, fill=color, state='normal')
+            update(text_id, text=text, state='normal')
+        
+        # Status badge pushed to far right
+        status = f"{emoji} {status_text}"
+        status_width = self._measure_issue_text('status', status) + 8
+        right = width - 10
+        if right != row_canvas._status_right:
+            row_canvas.move('status', right - row_canvas._status_right, 0)
+            row_canvas._status_right = right
+        if item_state.get('status_width') != status_width:
+            item_state['status_width'] = status_width
+            row_canvas.coords(items['status_bg'], right - status_width, 8, right, 30)
+            row_canvas.coords(items['status'], right - status_width / 2, 19)
+        update(items['status_bg'], fill=status_color)
+        update(items['status'], text=status)
+        
+        full_desc = f"{issue_emoji} {issue_desc}"
+        short_desc = self._truncate_issue_text(full_desc)
+        row_canvas._full_desc = full_desc if short_desc != full_desc else None
+        update(items['desc'], text=short_desc, fill=icon_color)
+    
+    def _truncate_issue_text(self, text, limit=60):
+        """Single-line form of an issue description (cached per description)"""
+        short = self._issue_desc_short.get(text)
+        if short is None:
+            short = self._issue_desc_short[text] = text if len(text) <= limit else text[:limit].rstrip() + '…'
+        return short
+    
+    def _show_issue_tooltip(self, row_canvas, event):
+        """Show the full description of a truncated issue row in the shared tooltip"""
+        text = row_canvas._full_desc
+        if text is None:
+            return
+        tooltip = getattr(self, '_issue_tooltip', None)
+        if tooltip is None or not tooltip.winfo_exists():
+            # One tooltip window per issues popup, reused by every row
+            tooltip = tk.Toplevel(row_canvas.winfo_toplevel())
+            tooltip.wm_overrideredirect(True)
+            tooltip._label = tk.Label(tooltip, font=("Segoe UI", 9), 
+                                      bg='#1a1a1a', fg='#ecf0f1', 
+                                      relief=tk.SOLID, bd=1, padx=6, pady=3, 
+                                      wraplength=400, justify=tk.LEFT)
+            tooltip._label.pack()
+            self._issue_tooltip = tooltip
+        tooltip._label.configure(text=text)
+        tooltip.wm_geometry(f"+{event.x_root + 12}+{event.y_root + 12}")
+        tooltip.deiconify()
+        tooltip.lift()
+    
+    def _hide_issue_tooltip(self, event=None):
+        """Hide the shared issue tooltip"""
+        tooltip = getattr(self, '_issue_tooltip', None)
+        if tooltip is not None and tooltip.winfo_exists():
+            tooltip.withdraw()
     
     def _create_consolidated_non_fixable_view(self, parent, non_fixable_files, sprite_type, canvas):
         """Create a consolidated view for non-fixable files to avoid UI clutter"""
@@ -5081,13 +5287,6 @@ class SpriteConverterGUI:
                                    bg='#3a3a3a', fg='#e74c3c')
         non_fixable_label.pack(anchor=tk.W, pady=(0, 10))
         
-        # Bind mousewheel to the header label immediately
-        def bind_header_mousewheel(event):
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        non_fixable_label.bind("<MouseWheel>", bind_header_mousewheel)
-        non_fixable_label.bind("<Button-4>", lambda e: bind_header_mousewheel(type('Event', (), {'delta': 120})()))
-        non_fixable_label.bind("<Button-5>", lambda e: bind_header_mousewheel(type('Event', (), {'delta': -120})()))
-        
         # Create consolidated container
         consolidated_frame = tk.Frame(parent, bg='#2a2a2a', relief=tk.RAISED, bd=2)
         consolidated_frame.pack(fill=tk.X, pady=(0, 10))
@@ -5108,10 +5307,10 @@ class SpriteConverterGUI:
         breakdown_frame.pack(fill=tk.X, padx=15, pady=(0, 10))
         
         # Analyze file patterns
-        normal_files = [f for f in non_fixable_files if '-n.gif' in f[0]]
-        shiny_files = [f for f in non_fixable_files if '-s.gif' in f[0]]
-        male_files = [f for f in non_fixable_files if '-m.gif' in f[0]]
-        female_files = [f for f in non_fixable_files if '-f.gif' in f[0]]
+        normal_files = [f for f in non_fixable_files if '-n.gif' in f.filename]
+        shiny_files = [f for f in non_fixable_files if '-s.gif' in f.filename]
+        male_files = [f for f in non_fixable_files if '-m.gif' in f.filename]
+        female_files = [f for f in non_fixable_files if '-f.gif' in f.filename]
         
         breakdown_text = f"📊 Breakdown: {len(normal_files)} normal, {len(shiny_files)} shiny"
         if male_files or female_files:
@@ -5149,40 +5348,13 @@ class SpriteConverterGUI:
         
         # Populate text widget with file list
         text_widget.config(state=tk.NORMAL)
-        for i, (filename, _) in enumerate(non_fixable_files):
-            text_widget.insert(tk.END, f"{i+1:4d}. {filename}\n")
+        for i, parsed in enumerate(non_fixable_files):
+            text_widget.insert(tk.END, f"{i+1:4d}. {parsed.filename}\n")
         text_widget.config(state=tk.DISABLED)
         
         text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         text_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # Bind mousewheel to text widget - handle its own scrolling only
-        def bind_text_mousewheel(event):
-            # Only scroll the text widget, don't forward to main canvas
-            text_widget.yview_scroll(int(-1*(event.delta/120)), "units")
-            # Stop event propagation to prevent main canvas scrolling
-            return "break"
-        text_widget.bind("<MouseWheel>", bind_text_mousewheel)
-        
-        # Bind mousewheel to all consolidated frame elements for proper scrolling
-        def bind_mousewheel_to_consolidated(widget):
-            """Recursively bind mousewheel to widget and all its children for main canvas scrolling"""
-            def _on_mousewheel(event):
-                canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-            widget.bind("<MouseWheel>", _on_mousewheel)
-            widget.bind("<Button-4>", lambda e: _on_mousewheel(type('Event', (), {'delta': 120})()))
-            widget.bind("<Button-5>", lambda e: _on_mousewheel(type('Event', (), {'delta': -120})()))
-            for child in widget.winfo_children():
-                # Skip the text widget - it handles its own scrolling
-                if child != text_widget:
-                    bind_mousewheel_to_consolidated(child)
-        
-        # Apply mousewheel binding to the entire consolidated frame
-        bind_mousewheel_to_consolidated(consolidated_frame)
-        
-        # Also bind mousewheel to the header label (in case it wasn't caught by recursive binding)
-        bind_mousewheel_to_consolidated(non_fixable_label)
-        
         # Store references for toggle functionality
         self._file_list_frames = getattr(self, '_file_list_frames', {})
         self._file_list_frames[f"{sprite_type}_toggle"] = (toggle_button, file_list_frame, text_widget)
@@ -5198,228 +5370,43 @@ class SpriteConverterGUI:
     
     def _populate_back_issues_tab(self, parent):
         """Populate the Back Issues tab with consolidated view for better performance"""
-        # Clear any existing content first
-        for widget in parent.winfo_children():
-            widget.destroy()
-        
-        # Get all unfulfilled files from the analysis
-        if not hasattr(self, 'unfulfilled_files') or not self.unfulfilled_files:
-            no_issues_label = tk.Label(parent, text="✅ No back file issues found!", 
-                                     font=("Segoe UI", 14), 
-                                     bg='#3a3a3a', fg='#27ae60')
-            no_issues_label.pack(pady=50)
-            return
-        
-        # Create scrollable list structure ONLY when there are issues
-        canvas = tk.Canvas(parent, bg='#3a3a3a', highlightthickness=0)
-        scrollbar = tk.Scrollbar(parent, orient="vertical", command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg='#3a3a3a')
-        
-        def update_scroll_region(event=None):
-            # Get the bounding box of all items
-            bbox = canvas.bbox("all")
-            if bbox:
-                # Ensure we have a minimum height to prevent scrolling above content
-                min_height = max(bbox[3] - bbox[1], canvas.winfo_height())
-                canvas.configure(scrollregion=(0, 0, bbox[2], min_height))
-            else:
-                # If no content, set scroll region to canvas size
-                canvas.configure(scrollregion=(0, 0, canvas.winfo_width(), canvas.winfo_height()))
-        
-        scrollable_frame.bind("<Configure>", update_scroll_region)
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        # Bind mousewheel to canvas for better scrolling
-        def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-        
-        canvas.bind("<MouseWheel>", _on_mousewheel)
-        canvas.bind("<Button-4>", lambda e: _on_mousewheel(type('Event', (), {'delta': 120})()))
-        canvas.bind("<Button-5>", lambda e: _on_mousewheel(type('Event', (), {'delta': -120})()))
-        
-        # Pack canvas and scrollbar
-        canvas.pack(side="left", fill="both", expand=True, padx=(20, 0), pady=20)
-        scrollbar.pack(side="right", fill="y", padx=(0, 20), pady=20)
-        
-        # Store current canvas for issue items to bind mousewheel events
-        self._back_issues_canvas = canvas
-        
-        # Collect all back files from unfulfilled_files
-        back_files = []
-        for filename, is_fixable in self.unfulfilled_files.items():
-            if '-back-' in filename:
-                back_files.append((filename, is_fixable))
-        
-        # Sort by dex number (lowest first)
-        def extract_dex_num(filename):
-            parts = filename.split('-')
-            try:
-                return int(parts[0])
-            except (ValueError, IndexError):
-                return 9999
-        
-        back_files.sort(key=lambda x: extract_dex_num(x[0]))
-        
-        if not back_files:
-            no_issues_label = tk.Label(scrollable_frame, text="✅ No back file issues found!", 
-                                     font=("Segoe UI", 14), 
-                                     bg='#3a3a3a', fg='#27ae60')
-            no_issues_label.pack(pady=50)
-        else:
-            # Separate fixable and non-fixable files
-            fixable_files = [f for f in back_files if f[1]]
-            non_fixable_files = [f for f in back_files if not f[1]]
-            
-            # Create main container
-            main_frame = tk.Frame(scrollable_frame, bg='#3a3a3a')
-            main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
-            
-            # Bind mousewheel to main frame
-            main_frame.bind("<MouseWheel>", lambda e: canvas.yview_scroll(int(-1*(e.delta/120)), "units"))
-            main_frame.bind("<Button-4>", lambda e: canvas.yview_scroll(int(-1*(120/120)), "units"))
-            main_frame.bind("<Button-5>", lambda e: canvas.yview_scroll(int(-1*(-120/120)), "units"))
-            
-            # Show fixable files individually (these are usually few and important)
-            if fixable_files:
-                fixable_label = tk.Label(main_frame, text=f"🔧 Fixable Issues ({len(fixable_files)})", 
-                                       font=("Segoe UI", 16, "bold"), 
-                                       bg='#3a3a3a', fg='#27ae60')
-                fixable_label.pack(anchor=tk.W, pady=(0, 10))
-                
-                # Create grid for fixable files
-                fixable_grid = tk.Frame(main_frame, bg='#3a3a3a')
-                fixable_grid.pack(fill=tk.X, pady=(0, 20))
-                fixable_grid.grid_columnconfigure(0, weight=1)
-                fixable_grid.grid_columnconfigure(1, weight=1)
-                
-                # Bind mousewheel to the grid frame for scrolling in empty spaces
-                def bind_grid_mousewheel(event):
-                    canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-                fixable_grid.bind("<MouseWheel>", bind_grid_mousewheel)
-                fixable_grid.bind("<Button-4>", lambda e: bind_grid_mousewheel(type('Event', (), {'delta': 120})()))
-                fixable_grid.bind("<Button-5>", lambda e: bind_grid_mousewheel(type('Event', (), {'delta': -120})()))
-                
-                for i, (filename, is_fixable) in enumerate(fixable_files):
-                    self._create_simple_issue_item(fixable_grid, filename, is_fixable, i, canvas)
-            
-            # Show non-fixable files in consolidated view
-            if non_fixable_files:
-                self._create_consolidated_non_fixable_view(main_frame, non_fixable_files, "back", canvas)
-        
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        self._populate_issues_tab(parent, "back", getattr(self, '_sorted_back_files', []))
     
     def _populate_fixes_tab(self, parent):
-        """Populate the Fixes tab with lightweight, fast-loading recommendations"""
-        # Clear any existing content first
-        for widget in parent.winfo_children():
-            widget.destroy()
+        """Populate the Fixes tab with recommendations grouped by operation type in a Treeview"""
+        widgets = self._create_fixes_tab_widgets(parent)
         
         # Check if we have recommendations available
         if not hasattr(self, 'current_recommendations') or not self.current_recommendations:
-            no_fixes_label = tk.Label(parent, text="✅ No fixes needed!", 
-                                    font=("Segoe UI", 14), 
-                                    bg='#3a3a3a', fg='#27ae60')
-            no_fixes_label.pack(pady=50)
+            widgets['no_fixes_label'].pack(pady=50)
             return
+        widgets['content_frame'].pack(fill=tk.BOTH, expand=True)
+        tree = widgets['tree']
         
-        # Create a simple scrollable list
-        canvas = tk.Canvas(parent, bg='#3a3a3a', highlightthickness=0)
-        scrollbar = tk.Scrollbar(parent, orient="vertical", command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg='#3a3a3a')
-        
-        def update_scroll_region(event=None):
-            # Get the bounding box of all items
-            bbox = canvas.bbox("all")
-            if bbox:
-                # Ensure we have a minimum height to prevent scrolling above content
-                min_height = max(bbox[3] - bbox[1], canvas.winfo_height())
-                canvas.configure(scrollregion=(0, 0, bbox[2], min_height))
-            else:
-                # If no content, set scroll region to canvas size
-                canvas.configure(scrollregion=(0, 0, canvas.winfo_width(), canvas.winfo_height()))
-        
-        scrollable_frame.bind("<Configure>", update_scroll_region)
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        # Bind mousewheel to canvas for better scrolling
-        def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        
-        def bind_mousewheel_to_widget(widget):
-            """Bind mousewheel to widget and all its children"""
-            widget.bind("<MouseWheel>", _on_mousewheel)
-            widget.bind("<Button-4>", lambda e: _on_mousewheel(type('Event', (), {'delta': 120})()))
-            widget.bind("<Button-5>", lambda e: _on_mousewheel(type('Event', (), {'delta': -120})()))
-            for child in widget.winfo_children():
-                bind_mousewheel_to_widget(child)
-        
-        # Bind mousewheel to canvas and all its children
-        bind_mousewheel_to_widget(canvas)
-        bind_mousewheel_to_widget(scrollable_frame)
-        
-        # Also bind to the entire scrollable frame to catch events in empty spaces
-        scrollable_frame.bind("<MouseWheel>", _on_mousewheel)
-        scrollable_frame.bind("<Button-4>", lambda e: _on_mousewheel(type('Event', (), {'delta': 120})()))
-        scrollable_frame.bind("<Button-5>", lambda e: _on_mousewheel(type('Event', (), {'delta': -120})()))
-        
-        # Bind mousewheel to the scrollable frame's children recursively
-        def bind_mousewheel_to_children(parent):
-            """Recursively bind mousewheel to all children of a parent widget"""
-            for child in parent.winfo_children():
-                child.bind("<MouseWheel>", _on_mousewheel)
-                child.bind("<Button-4>", lambda e: _on_mousewheel(type('Event', (), {'delta': 120})()))
-                child.bind("<Button-5>", lambda e: _on_mousewheel(type('Event', (), {'delta': -120})()))
-                bind_mousewheel_to_children(child)
-        
-        bind_mousewheel_to_children(scrollable_frame)
-        
-        # Also bind to the parent frame to catch events in empty spaces
-        parent.bind("<MouseWheel>", _on_mousewheel)
-        parent.bind("<Button-4>", lambda e: _on_mousewheel(type('Event', (), {'delta': 120})()))
-        parent.bind("<Button-5>", lambda e: _on_mousewheel(type('Event', (), {'delta': -120})()))
-        
-        # Make scrollable frame focusable and bind mousewheel events
-        scrollable_frame.bind("<Enter>", lambda e: scrollable_frame.focus_set())
-        scrollable_frame.focus_set()
-        
-        # Ensure scrollable frame can handle mousewheel events
-        scrollable_frame.configure(takefocus=True)
-        
-        # Ensure canvas can handle mousewheel events
-        canvas.configure(takefocus=True)
-        canvas.focus_set()
-        
-        # Store current canvas for recommendation cards to bind mousewheel events
-        self._fixes_canvas = canvas
-        
-        # Group recommendations by operation type (normalized for grouping)
-        def normalize_operation_type_for_grouping(action):
-            """Normalize action types for grouping - group similar actions together"""
-            if action in ['create_gender_variant', 'create_gender_variant_from_other']:
-                return 'create_gender_variant'
-            elif action in ['create_base_from_male', 'create_base_from_female']:
-                return 'create_base'
-            elif action == 'remove':
-                return 'remove'  # Keep remove operations separate
-            elif action == 'cleanup':
-                return 'cleanup'  # Keep cleanup operations separate
-            else:
-                return action
-        
+        # Group recommendations by operation type (similar actions share a section)
+        group_aliases = self._OPERATION_GROUP_ALIASES
         operation_groups = {}
         for rec in self.current_recommendations:
-            operation_type = normalize_operation_type_for_grouping(rec['action'])
+            operation_type = group_aliases.get(rec['action'], rec['action'])
             if operation_type not in operation_groups:
                 operation_groups[operation_type] = []
             operation_groups[operation_type].append(rec)
         
+        self._fill_fixes_tree(tree, operation_groups)
+    
+    def _create_fixes_tab_widgets(self, parent):
+        """Build the header, search bar, buttons and tree of the Fixes tab (content left unpacked)"""
+        # Clear any existing content first
+        for widget in parent.winfo_children():
+            widget.destroy()
+        
+        no_fixes_label = tk.Label(parent, text="✅ No fixes needed!", 
+                                font=("Segoe UI", 14), 
+                                bg='#3a3a3a', fg='#27ae60')
+        content_frame = tk.Frame(parent, bg='#3a3a3a')
+        
         # Simple header
-        header_frame = tk.Frame(parent, bg='#3a3a3a')
+        header_frame = tk.Frame(content_frame, bg='#3a3a3a')
         header_frame.pack(fill=tk.X, padx=20, pady=10)
         
         # Search bar
@@ -5442,7 +5429,7 @@ class SpriteConverterGUI:
         self.fixes_search_entry = search_entry
         
         # Bind search functionality
-        search_entry.bind('<KeyRelease>', self.filter_fixes)
+        search_entry.bind('<KeyRelease>', self._schedule_filter_fixes)
         search_entry.bind('<Button-1>', self.clear_search_placeholder)
         search_entry.bind('<FocusIn>', self.clear_search_placeholder)
         search_entry.bind('<FocusOut>', self.restore_search_placeholder)
@@ -5453,346 +5440,17 @@ class SpriteConverterGUI:
                            bg='#27ae60', fg='white', font=("Segoe UI", 9))
         copy_btn.pack(side=tk.RIGHT)
         
-        # Add recommendations grouped by operation type
-        self.recommendation_vars = []
-        self.all_rec_frames = []
-        self.all_section_frames = []
-        self.all_grid_containers = []
-        
-        # Sort operation types by count (least issues first)
-        sorted_operations = sorted(operation_groups.keys(), key=lambda x: len(operation_groups[x]))
-        for operation_type in sorted_operations:
-            recommendations = operation_groups[operation_type]
-            
-            # Determine section colors based on operation type (dark theme)
-            section_colors = {
-                'replacement': {'color': '#27ae60', 'icon': '🔄'},
-                'rename': {'color': '#3498db', 'icon': '📝'},
-                'remove': {'color': '#e74c3c', 'icon': '🗑️'},
-                'cleanup': {'color': '#e74c3c', 'icon': '🧹'},
-                'remove_base': {'color': '#e74c3c', 'icon': '🗑️'},
-                'create_gender_variant': {'color': '#3498db', 'icon': '👥'},
-                'create_base': {'color': '#9b59b6', 'icon': '📄'},
-                'clone': {'color': '#9b59b6', 'icon': '📋'},
-                'comprehensive_replacement': {'color': '#f39c12', 'icon': '🔧'},
-                'retain_extra': {'color': '#34495e', 'icon': '💾'}
-            }
-            
-            section_info = section_colors.get(operation_type, {'color': '#95a5a6', 'icon': '⚙️'})
-            section_color = section_info['color']
-            section_icon = section_info['icon']
-            
-            # Create collapsible section header with dark theme
-            section_frame = tk.Frame(scrollable_frame, bg='#2a2a2a', relief=tk.RAISED, bd=1)
-            section_frame._operation_section_header = operation_type
-            self.all_section_frames.append(section_frame)
-            section_frame.pack(fill=tk.X, padx=10, pady=(10, 3))
-            
-            # Bind mousewheel to section frame and all its children
-            def bind_mousewheel_to_section(widget):
-                """Bind mousewheel to section widget and all its children"""
-                if hasattr(self, '_fixes_canvas') and self._fixes_canvas:
-                    def _on_mousewheel(event):
-                        self._fixes_canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-                        return "break"  # Prevent event from propagating further
-                    widget.bind("<MouseWheel>", _on_mousewheel)
-                    widget.bind("<Button-4>", lambda e: _on_mousewheel(type('Event', (), {'delta': 120})()))
-                    widget.bind("<Button-5>", lambda e: _on_mousewheel(type('Event', (), {'delta': -120})()))
-                    for child in widget.winfo_children():
-                        bind_mousewheel_to_section(child)
-            
-            bind_mousewheel_to_section(section_frame)
-            
-            # Section header with expand/collapse button
-            header_frame = tk.Frame(section_frame, bg='#2a2a2a')
-            header_frame.pack(fill=tk.X, padx=10, pady=8)
-            
-            # Bind mousewheel to header frame as well
-            def bind_mousewheel_to_header(widget):
-                """Bind mousewheel to header widget and all its children"""
-                if hasattr(self, '_fixes_canvas') and self._fixes_canvas:
-                    def _on_mousewheel(event):
-                        self._fixes_canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-                        return "break"  # Prevent event from propagating further
-                    widget.bind("<MouseWheel>", _on_mousewheel)
-                    widget.bind("<Button-4>", lambda e: _on_mousewheel(type('Event', (), {'delta': 120})()))
-                    widget.bind("<Button-5>", lambda e: _on_mousewheel(type('Event', (), {'delta': -120})()))
-                    for child in widget.winfo_children():
-                        bind_mousewheel_to_header(child)
-            
-            bind_mousewheel_to_header(header_frame)
-            
-            
-            # Operation type and count with dark theme
-            operation_display_name = operation_type.replace('_', ' ').upper()
-            count_text = f"{section_icon} {operation_display_name} ({len(recommendations)} operations)"
-            count_label = tk.Label(header_frame, 
-                                 text=count_text,
-                                 font=("Segoe UI", 12, "bold"), 
-                                 bg='#2a2a2a', fg='#ffffff')
-            count_label.pack(side=tk.LEFT)
-            
-            # Bind mousewheel to count label as well
-            if hasattr(self, '_fixes_canvas') and self._fixes_canvas:
-                def _on_mousewheel(event):
-                    self._fixes_canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-                    return "break"  # Prevent event from propagating further
-                count_label.bind("<MouseWheel>", _on_mousewheel)
-                count_label.bind("<Button-4>", lambda e: _on_mousewheel(type('Event', (), {'delta': 120})()))
-                count_label.bind("<Button-5>", lambda e: _on_mousewheel(type('Event', (), {'delta': -120})()))
-            
-            # Select all for this operation type
-            def select_operation_all(op_type):
-                for rec_var, rec in zip(self.recommendation_vars, self.current_recommendations):
-                    normalized_type = normalize_operation_type_for_grouping(rec['action'])
-                    if normalized_type == op_type:
-                        rec_var.set(True)
-            
-            select_operation_btn = tk.Button(header_frame, text="✓ Select All", 
-                                     command=lambda op=operation_type: select_operation_all(op),
-                                     bg=section_color, fg='white', font=("Segoe UI", 10, "bold"),
-                                     width=12, height=1, relief=tk.RAISED, bd=2)
-            select_operation_btn.pack(side=tk.RIGHT)
-            
-            # Bind mousewheel to Select All button as well
-            if hasattr(self, '_fixes_canvas') and self._fixes_canvas:
-                def _on_mousewheel(event):
-                    self._fixes_canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-                    return "break"  # Prevent event from propagating further
-                select_operation_btn.bind("<MouseWheel>", _on_mousewheel)
-                select_operation_btn.bind("<Button-4>", lambda e: _on_mousewheel(type('Event', (), {'delta': 120})()))
-                select_operation_btn.bind("<Button-5>", lambda e: _on_mousewheel(type('Event', (), {'delta': -120})()))
-            
-            # Create a grid container for compact cards
-            grid_container = tk.Frame(scrollable_frame, bg='#3a3a3a')
-            grid_container.pack(fill=tk.X, padx=10, pady=5)
-            grid_container._operation_type = operation_type
-            grid_container._section_frame = section_frame
-            self.all_grid_containers.append(grid_container)
-            
-            # Bind mousewheel to grid container
-            grid_container.bind("<MouseWheel>", lambda e: canvas.yview_scroll(int(-1*(e.delta/120)), "units"))
-            grid_container.bind("<Button-4>", lambda e: canvas.yview_scroll(int(-1*(120/120)), "units"))
-            grid_container.bind("<Button-5>", lambda e: canvas.yview_scroll(int(-1*(-120/120)), "units"))
-            
-            # Sort recommendations by dex number (lowest first)
-            def extract_dex_from_rec(rec):
-                from_field = rec.get('from')
-                if not from_field:
-                    return 9999  # Put items with no 'from' at the end
-                if isinstance(from_field, list):
-                    # For comprehensive operations, use the first file in the list
-                    filename = from_field[0] if from_field else ''
-                else:
-                    filename = from_field
-                match = re.match(r'^(\d{3,4})', filename)
-                return int(match.group(1)) if match else 9999
-            
-            recommendations.sort(key=extract_dex_from_rec)
-            
-            # Add individual recommendations in compact grid format
-            for i, rec in enumerate(recommendations):
-                # Extract dex number for display
-                from_field = rec.get('from')
-                if not from_field:
-                    dex_num = "000"  # Default for items with no 'from'
-                elif isinstance(from_field, list):
-                    # For comprehensive operations, use the first file in the list
-                    filename = from_field[0] if from_field else ''
-                    match = re.match(r'^(\d{3,4})', filename)
-                    dex_num = match.group(1) if match else "000"
-                else:
-                    match = re.match(r'^(\d{3,4})', from_field)
-                    dex_num = match.group(1) if match else "000"
-                
-                # Get action display info using the new mapping function
-                action_display_name, action_color = self._get_action_display_info(rec['action'])
-                
-                # Get action icon
-                action_icons = {
-                    'replacement': '🔄',
-                    'rename': '📝',
-                    'remove': '🗑️',
-                    'cleanup': '🧹',
-                    'remove_base': '🗑️',
-                    'create_gender_variant': '👥',
-                    'create_gender_variant_from_other': '👥',
-                    'create_gender_variant_with_cleanup': '👥🧹',
-                    'create_base_from_male': '📄',
-                    'create_base_from_female': '📄',
-                    'create_base_with_cleanup': '📄🧹',
-                    'clone': '📋',
-                    'comprehensive_replacement': '🔧',
-                    'retain_extra': '💾'
-                }
-                action_icon = action_icons.get(rec['action'], '⚙️')
-                
-                # Create compact card frame
-                card_frame = tk.Frame(grid_container, bg='#2a2a2a', relief=tk.RAISED, bd=1)
-                card_frame._operation_type = operation_type
-                card_frame._rec_data = rec
-                card_frame._section_header = section_frame
-                self.all_rec_frames.append(card_frame)
-                
-                # Grid positioning (2 columns)
-                # Calculate grid position to ensure top-to-bottom, left-to-right visual order
-                row = i // 2
-                col = i % 2
-                card_frame.grid(row=row, column=col, padx=5, pady=3, sticky='ew')
-                
-                # Configure grid weights for equal columns
-                grid_container.grid_columnconfigure(0, weight=1)
-                grid_container.grid_columnconfigure(1, weight=1)
-                
-                # Checkbox
-                var = tk.BooleanVar(value=True)
-                self.recommendation_vars.append(var)
-                checkbox = tk.Checkbutton(card_frame, variable=var, bg='#2a2a2a', 
-                                        activebackground='#2a2a2a', selectcolor='#555555')
-                checkbox.pack(side=tk.LEFT, padx=5, pady=5)
-                
-                # Main content frame
-                content_frame = tk.Frame(card_frame, bg='#2a2a2a')
-                content_frame.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5, pady=5)
-                
-                # Header: Pokemon number + action type
-                header_frame = tk.Frame(content_frame, bg='#2a2a2a')
-                header_frame.pack(fill=tk.X)
-                
-                dex_label = tk.Label(header_frame, text=f"#{dex_num}", 
-                                   font=("Segoe UI", 10, "bold"), 
-                                   bg='#2a2a2a', fg='#ffffff')
-                dex_label.pack(side=tk.LEFT, padx=(0, 8))
-                
-                action_type_text = f"{action_icon} {action_display_name}"
-                action_type_label = tk.Label(header_frame, text=action_type_text, 
-                                           font=("Segoe UI", 9, "bold"), 
-                                           bg='#2a2a2a', fg=action_color)
-                action_type_label.pack(side=tk.LEFT)
-                
-                # Add "FROM X OPERATIONS" text for cleanup operations
-                if rec.get('action') == 'cleanup' and rec.get('source_operation_count'):
-                    from_ops_text = f"FROM {rec['source_operation_count']} OPERATIONS"
-                    from_ops_label = tk.Label(header_frame, text=from_ops_text, 
-                                            font=("Segoe UI", 9, "bold"), 
-                                            bg='#2a2a2a', fg='#ffffff')
-                    from_ops_label.pack(side=tk.LEFT, padx=(8, 0))
-                
-                # Source file (compact) - skip for cleanup operations
-                if rec.get('action') != 'cleanup':
-                    if isinstance(rec['from'], list):
-                        source_text = f"FROM: {' + '.join(rec['from'])}"
-                    else:
-                        source_text = f"FROM: {rec['from']}"
-                    
-                    source_label = tk.Label(content_frame, text=source_text, 
-                                          font=("Consolas", 8), 
-                                          bg='#2a2a2a', fg='#e74c3c')
-                    source_label.pack(anchor=tk.W, pady=1)
-                
-                # Target files (compact)
-                if 'to' in rec and rec['to']:
-                    if isinstance(rec['to'], list):
-                        targets = ', '.join(rec['to'][:2])  # Show first 2, truncate if more
-                        if len(rec['to']) > 2:
-                            targets += f" (+{len(rec['to'])-2} more)"
-                        target_text = f"TO: {targets}"
-                    else:
-                        target_text = f"TO: {rec['to']}"
-                    
-                    target_label = tk.Label(content_frame, text=target_text, 
-                                          font=("Consolas", 8), 
-                                          bg='#2a2a2a', fg='#27ae60')
-                    target_label.pack(anchor=tk.W, pady=1)
-                
-                # Cleanup files (for cleanup operations) - show first 4 files with expand button
-                if rec.get('action') == 'cleanup' and rec.get('cleanup_files'):
-                    cleanup_files = rec['cleanup_files']
-                    if isinstance(cleanup_files, list):
-                        # Show first 4 files initially
-                        files_to_show = cleanup_files[:4]
-                        files_per_line = 2
-                        
-                        # Display the first 4 files
-                        for i in range(0, len(files_to_show), files_per_line):
-                            line_files = files_to_show[i:i + files_per_line]
-                            cleanup_text = " • ".join(line_files)
-                            cleanup_label = tk.Label(content_frame, text=cleanup_text, 
-                                                   font=("Consolas", 8), 
-                                                   bg='#2a2a2a', fg='#e74c3c')
-                            cleanup_label.pack(anchor=tk.W, pady=0)
-                        
-                        # Add expand button if there are more than 4 files
-                        if len(cleanup_files) > 4:
-                            expand_frame = tk.Frame(content_frame, bg='#2a2a2a')
-                            expand_frame.pack(anchor=tk.W, pady=2)
-                            
-                            expand_button = tk.Button(expand_frame, 
-                                                    text="Show all files", 
-                                                    command=lambda f=cleanup_files, ef=expand_frame: self._expand_cleanup_files(f, ef),
-                                                    font=("Consolas", 7), 
-                                                    bg='#e74c3c', fg='white',
-                                                    relief='flat', bd=0,
-                                                    padx=5, pady=2)
-                            expand_button.pack(side=tk.LEFT)
-                            
-                            # Bind mousewheel events to the expand button for scrolling
-                            if hasattr(self, '_fixes_canvas') and self._fixes_canvas:
-                                expand_button.bind("<MouseWheel>", lambda e: self._fixes_canvas.yview_scroll(int(-1*(e.delta/120)), "units"))
-                                expand_button.bind("<Button-4>", lambda e: self._fixes_canvas.yview_scroll(int(-1*(120/120)), "units"))
-                                expand_button.bind("<Button-5>", lambda e: self._fixes_canvas.yview_scroll(int(-1*(-120/120)), "units"))
-                
-                # Files to remove (compact) - skip for cleanup operations since they have their own display
-                if rec.get('files_to_remove') and rec.get('action') != 'cleanup':
-                    if isinstance(rec['files_to_remove'], list):
-                        removes = ', '.join(rec['files_to_remove'][:2])  # Show first 2
-                        if len(rec['files_to_remove']) > 2:
-                            removes += f" (+{len(rec['files_to_remove'])-2} more)"
-                        remove_text = f"REMOVE: {removes}"
-                    else:
-                        remove_text = f"REMOVE: {rec['files_to_remove']}"
-                    
-                    remove_label = tk.Label(content_frame, text=remove_text, 
-                                          font=("Consolas", 8), 
-                                          bg='#2a2a2a', fg='#e67e22')
-                    remove_label.pack(anchor=tk.W, pady=1)
-                
-                # Copy button
-                copy_btn = tk.Button(card_frame, text="📋", 
-                                   command=lambda r=rec: self.copy_issue_to_clipboard(r),
-                                   bg=action_color, fg='white', font=("Segoe UI", 8),
-                                   width=2, height=1)
-                copy_btn.pack(side=tk.RIGHT, padx=5, pady=5)
-                
-                # Bind mousewheel to this card and all its children for scrolling
-                def bind_mousewheel_recursive(widget):
-                    """Recursively bind mousewheel to widget and all its children"""
-                    if hasattr(self, '_fixes_canvas') and self._fixes_canvas:
-                        def _on_mousewheel(event):
-                            self._fixes_canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-                        widget.bind("<MouseWheel>", _on_mousewheel)
-                        widget.bind("<Button-4>", lambda e: _on_mousewheel(type('Event', (), {'delta': 120})()))
-                        widget.bind("<Button-5>", lambda e: _on_mousewheel(type('Event', (), {'delta': -120})()))
-                        for child in widget.winfo_children():
-                            bind_mousewheel_recursive(child)
-                
-                bind_mousewheel_recursive(card_frame)
-        
-        
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-        
-        # Buttons
-        button_frame = tk.Frame(parent, bg='#3a3a3a')
-        button_frame.pack(fill=tk.X, padx=20, pady=(0, 20))
+        # Buttons (packed before the tree so they keep their space at the bottom)
+        button_frame = tk.Frame(content_frame, bg='#3a3a3a')
+        button_frame.pack(side=tk.BOTTOM, fill=tk.X, padx=20, pady=(0, 20))
         
         select_all_btn = tk.Button(button_frame, text="Select All", 
-                                  command=lambda: [var.set(True) for var in self.recommendation_vars],
+                                  command=lambda: self._set_all_fixes_checked(True),
                                   bg='#3498db', fg='white', font=("Segoe UI", 9))
         select_all_btn.pack(side=tk.LEFT, padx=(0, 5))
         
         select_none_btn = tk.Button(button_frame, text="Select None", 
-                                   command=lambda: [var.set(False) for var in self.recommendation_vars],
+                                   command=lambda: self._set_all_fixes_checked(False),
                                    bg='#95a5a6', fg='white', font=("Segoe UI", 9))
         select_none_btn.pack(side=tk.LEFT, padx=(0, 5))
         
@@ -5805,170 +5463,354 @@ class SpriteConverterGUI:
                               command=parent.winfo_toplevel().destroy,
                               bg='#e74c3c', fg='white', font=("Segoe UI", 9))
         cancel_btn.pack(side=tk.RIGHT, padx=(5, 0))
+        
+        # One Treeview holds every fix: a top-level row per operation type, a child row
+        # per recommendation. Tk only draws the visible rows and scrolls natively.
+        style = ttk.Style()
+        style.configure('Fixes.Treeview', background='#2a2a2a', fieldbackground='#2a2a2a',
+                        foreground='#e0e0e0', font=("Segoe UI", 9), rowheight=24, borderwidth=0)
+        style.configure('Fixes.Treeview.Heading', background='#3a3a3a', foreground='#e0e0e0',
+                        font=("Segoe UI", 9, "bold"), borderwidth=0)
+        style.map('Fixes.Treeview', background=[('selected', '#4a4a4a')])
+        
+        tree_frame = tk.Frame(content_frame, bg='#3a3a3a')
+        tree_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=(0, 10))
+        
+        tree = ttk.Treeview(tree_frame, columns=("from", "to", "remove"), 
+                            show="tree headings", style='Fixes.Treeview')
+        tree.heading('#0', text="Fix", anchor=tk.W)
+        tree.heading('from', text="From", anchor=tk.W)
+        tree.heading('to', text="To", anchor=tk.W)
+        tree.heading('remove', text="Removes / Cleans Up", anchor=tk.W)
+        tree.column('#0', width=340, minwidth=200)
+        for column in ("from", "to", "remove"):
+            tree.column(column, width=240, minwidth=120)
+        
+        scrollbar = tk.Scrollbar(tree_frame, orient="vertical", command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        tree.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+        
+        tree.tag_configure('fix_group', font=("Segoe UI", 11, "bold"), foreground='#ffffff')
+        tree.tag_configure('cleanup_file', font=("Consolas", 8), foreground='#e74c3c')
+        
+        # Checkbox click toggles, double-click copies, space/Ctrl+C act on the selection
+        tree.bind('<Button-1>', self._on_fix_tree_click)
+        tree.bind('<Double-1>', self._on_fix_tree_double_click)
+        tree.bind('<space>', self._on_fix_tree_space)
+        tree.bind('<Control-c>', lambda e: self._copy_selected_fixes())
+        tree.bind('<<TreeviewOpen>>', self._on_fix_tree_open)
+        
+        return {
+            'tree': tree,
+            'no_fixes_label': no_fixes_label,
+            'content_frame': content_frame,
+        }
+    
+    def _fill_fixes_tree(self, tree, operation_groups):
+        """Insert a group row per operation type and a checkable row per recommendation"""
+        # Add recommendations grouped by operation type
+        self._fixes_tree = tree
+        self._recs_by_priority = {}  # priority -> [(rec, rec row iid)] for apply_recommendations
+        self._fix_items = {}  # rec row iid -> (rec, label)
+        self._fix_unchecked = set()  # rec row iids the user deselected; every fix starts selected
+        self._fix_group_labels = {}  # group row iid -> label
+        self._fix_groups = []  # [(group iid, [rec row iids])] in display order
+        self._fix_pending_children = {}  # rec row iid -> cleanup lines not yet inserted
+        self._fix_filter_state = ('', {})  # (last search text, group iid -> rec iids shown under it)
+        self._fix_search_texts = {}  # rec row iid -> lowercased text the search box matches against
+        check_images = self._fix_check_images()
+        configured_actions = set()
+        iid_by_rec = {}  # id(rec) -> rec row iid
+        
+        # Sort operation types by count (least issues first)
+        sorted_operations = sorted(operation_groups.keys(), key=lambda x: len(operation_groups[x]))
+        for operation_type in sorted_operations:
+            recommendations = operation_groups[operation_type]
+            
+            # Determine section colors based on operation type (dark theme)
+            section_color, section_icon = self._SECTION_COLORS.get(operation_type, ('#95a5a6', '⚙️'))
+            group_tag = f"group:{operation_type}"
+            tree.tag_configure(group_tag, background=section_color)
+            
+            # Operation type and count
+            operation_display_name = operation_type.replace('_', ' ').upper()
+            group_label = f"{section_icon} {operation_display_name} ({len(recommendations)} operations)"
+            group_iid = tree.insert('', 'end', text=group_label, image=check_images[True], 
+                                    open=True, tags=('fix_group', group_tag))
+            self._fix_group_labels[group_iid] = group_label
+            
+            # Sort recommendations by dex number (lowest first, items with no 'from' at the end);
+            # the dex is parsed once per fix and reused for its row label
+            dex_recs = [(self._rec_dex(rec), rec) for rec in recommendations]
+            dex_recs.sort(key=lambda item: int(item[0]) if item[0] else 9999)
+            
+            rec_iids = []
+            for dex_num, rec in dex_recs:
+                action_tag = f"action:{rec['action']}"
+                if action_tag not in configured_actions:
+                    tree.tag_configure(action_tag, foreground=self._get_action_display_info(rec['action'])[1])
+                    configured_actions.add(action_tag)
+                
+                label, values, extra_lines = self._describe_fix_row(rec, dex_num or "000")
+                iid = tree.insert(group_iid, 'end', text=label, values=values, 
+                                  image=check_images[True], tags=(action_tag,))
+                self._fix_items[iid] = (rec, label)
+                iid_by_rec[id(rec)] = iid
+                self._fix_search_texts[iid] = self._fix_searchable_text(rec)
+                rec_iids.append(iid)
+                
+                # Cleanup files beyond the first four are child rows, collapsed by default.
+                # Only a placeholder is inserted now; the real rows are added on first open.
+                if extra_lines:
+                    self._fix_pending_children[iid] = extra_lines
+                    tree.insert(iid, 'end', text="…", tags=('cleanup_file',))
+            
+            self._fix_groups.append((group_iid, rec_iids))
+            self._fix_filter_state[1][group_iid] = rec_iids
+        
+        # Tiers keep the generated recommendation order (not the display order), so fixes
+        # within one priority are applied in the same order as a stable sort would give
+        for rec in self.current_recommendations:
+            iid = iid_by_rec.get(id(rec))
+            if iid is not None:
+                priority = self._OPERATION_PRIORITY.get(rec['action'], 999)
+                self._recs_by_priority.setdefault(priority, []).append((rec, iid))
+    
+    @staticmethod
+    def _rec_dex(rec):
+        """Dex number (as written) of a recommendation's source file, or None if it has none"""
+        from_field = rec.get('from')
+        if isinstance(from_field, list):
+            # For comprehensive operations, use the first file in the list
+            from_field = from_field[0] if from_field else ''
+        match = _DEX_RE.match(from_field) if from_field else None
+        return match.group(1) if match else None
+    
+    @staticmethod
+    def _fix_searchable_text(rec):
+        """Lowercased filenames, action, targets and cleanup files the fixes search matches against"""
+        searchable_text = f"{rec['from']} {rec['action']}"
+        if 'to' in rec:
+            if isinstance(rec['to'], list):
+                searchable_text += " " + " ".join(rec['to'])
+            else:
+                searchable_text += " " + str(rec['to'])
+        if rec.get('action') == 'cleanup' and rec.get('cleanup_files'):
+            searchable_text += " " + " ".join(rec['cleanup_files'])
+        return searchable_text.lower()
+    
+    def _describe_fix_row(self, rec, dex_num):
+        """Build the tree label, column values and extra cleanup lines for one recommendation"""
+        # Header: Pokemon number + action type
+        action_display_name, _ = self._get_action_display_info(rec['action'])
+        action_icon = self._ACTION_ICONS.get(rec['action'], '⚙️')
+        label = f"#{dex_num}  {action_icon} {action_display_name}"
+        
+        # Add "FROM X OPERATIONS" text for cleanup operations
+        if rec.get('action') == 'cleanup' and rec.get('source_operation_count'):
+            label += f"  FROM {rec['source_operation_count']} OPERATIONS"
+        
+        # Source file - skip for cleanup operations
+        source_text = ""
+        if rec.get('action') != 'cleanup':
+            if isinstance(rec['from'], list):
+                source_text = ' + '.join(rec['from'])
+            else:
+                source_text = str(rec['from'])
+        
+        # Target files
+        target_text = ""
+        if 'to' in rec and rec['to']:
+            if isinstance(rec['to'], list):
+                target_text = ', '.join(rec['to'][:2])  # Show first 2, truncate if more
+                if len(rec['to']) > 2:
+                    target_text += f" (+{len(rec['to'])-2} more)"
+            else:
+                target_text = str(rec['to'])
+        
+        # Cleanup files (first 4 inline, the rest as child rows) or files to remove
+        remove_text = ""
+        extra_lines = []
+        if rec.get('action') == 'cleanup' and rec.get('cleanup_files'):
+            cleanup_files = rec['cleanup_files']
+            if isinstance(cleanup_files, list):
+                remove_text = " • ".join(cleanup_files[:4])
+                if len(cleanup_files) > 4:
+                    remove_text += f" (+{len(cleanup_files)-4} more)"
+                    remaining_files = cleanup_files[4:]
+                    files_per_line = 2
+                    extra_lines = [" • ".join(remaining_files[i:i + files_per_line])
+                                   for i in range(0, len(remaining_files), files_per_line)]
+        elif rec.get('files_to_remove'):
+            if isinstance(rec['files_to_remove'], list):
+                remove_text = ', '.join(rec['files_to_remove'][:2])  # Show first 2
+                if len(rec['files_to_remove']) > 2:
+                    remove_text += f" (+{len(rec['files_to_remove'])-2} more)"
+            else:
+                remove_text = str(rec['files_to_remove'])
+        
+        return label, (source_text, target_text, remove_text), extra_lines
+    
+    def _fix_check_images(self):
+        """Checked/unchecked box images used as the checkbox of each fix row, drawn once"""
+        if not hasattr(self, '_check_images'):
+            size = 12
+            self._check_images = {}
+            for checked in (False, True):
+                image = tk.PhotoImage(width=size, height=size)
+                border = '#27ae60' if checked else '#95a5a6'
+                image.put(border, to=(0, 0, size, size))
+                if not checked:
+                    image.put('#2a2a2a', to=(1, 1, size - 1, size - 1))
+                else:
+                    # Simple white tick
+                    for x, y in ((3, 5), (4, 6), (5, 7), (6, 6), (7, 5), (8, 4), (9, 3)):
+                        image.put('#ffffff', to=(x, y, x + 1, y + 2))
+                self._check_images[checked] = image
+        return self._check_images
+    
+    def _set_fix_checked(self, iid, checked):
+        """Set a fix row's selection state and redraw its checkbox"""
+        # Selection lives in a plain set; Tk is only told when the checkbox has to change
+        if (iid not in self._fix_unchecked) == checked:
+            return
+        if checked:
+            self._fix_unchecked.discard(iid)
+        else:
+            self._fix_unchecked.add(iid)
+        self._fixes_tree.item(iid, image=self._check_images[checked])
+    
+    def _refresh_fix_group_check(self, group_iid):
+        """Show a group's checkbox as checked only when all of its fixes are selected"""
+        all_checked = self._fix_unchecked.isdisjoint(self._fix_filter_state[1][group_iid])
+        self._fixes_tree.item(group_iid, image=self._check_images[all_checked])
+    
+    def _set_all_fixes_checked(self, checked):
+        """Select or deselect every fix (Select All / Select None buttons)"""
+        for group_iid, rec_iids in self._fix_groups:
+            for iid in rec_iids:
+                self._set_fix_checked(iid, checked)
+            self._fixes_tree.item(group_iid, image=self._check_images[checked])
+    
+    def _toggle_fix_rows(self, iids):
+        """Toggle fix rows; a group row selects all of its visible fixes, or clears them if all are selected"""
+        tree = self._fixes_tree
+        touched_groups = set()
+        for iid in iids:
+            if iid in self._fix_group_labels:
+                children = self._fix_filter_state[1][iid]
+                checked = not self._fix_unchecked.isdisjoint(children)
+                for child in children:
+                    self._set_fix_checked(child, checked)
+                touched_groups.add(iid)
+            elif iid in self._fix_items:
+                self._set_fix_checked(iid, iid in self._fix_unchecked)
+                touched_groups.add(tree.parent(iid))
+        for group_iid in touched_groups:
+            self._refresh_fix_group_check(group_iid)
+    
+    def _on_fix_tree_click(self, event):
+        """Toggle a fix when its checkbox image is clicked"""
+        tree = event.widget
+        if 'image' not in tree.identify_element(event.x, event.y):
+            return
+        iid = tree.identify_row(event.y)
+        if iid:
+            self._toggle_fix_rows([iid])
+            return "break"
+    
+    def _on_fix_tree_open(self, event):
+        """Insert a cleanup fix's remaining file rows the first time it is expanded"""
+        tree = event.widget
+        iid = tree.focus()
+        lines = self._fix_pending_children.pop(iid, None)
+        if lines:
+            tree.delete(*tree.get_children(iid))
+            for line in lines:
+                tree.insert(iid, 'end', text=line, tags=('cleanup_file',))
+    
+    def _on_fix_tree_double_click(self, event):
+        """Copy a fix to the clipboard on double-click"""
+        iid = event.widget.identify_row(event.y)
+        if iid in self._fix_items:
+            self.copy_issue_to_clipboard(self._fix_items[iid][0])
+            return "break"
+    
+    def _on_fix_tree_space(self, event):
+        """Toggle every selected fix row"""
+        self._toggle_fix_rows(event.widget.selection())
+        return "break"
+    
+    def _copy_selected_fixes(self):
+        """Copy the selected fix rows to the clipboard"""
+        recs = [self._fix_items[iid][0] for iid in self._fixes_tree.selection() if iid in self._fix_items]
+        if recs:
+            self.copy_all_issues_to_clipboard(recs)
+    
+    def _schedule_filter_fixes(self, event=None):
+        """Filter the fixes once typing pauses, so a held key doesn't filter on every repeat"""
+        if getattr(self, '_search_job', None):
+            self.root.after_cancel(self._search_job)
+        self._search_job = self.root.after(60, self._run_filter_fixes_job)
+    
+    def _run_filter_fixes_job(self):
+        """Run the debounced fixes filter"""
+        self._search_job = None
+        self.filter_fixes()
     
     def filter_fixes(self, event=None):
         """Filter fixes based on search text"""
-        if not hasattr(self, 'fixes_search_entry'):
+        if not hasattr(self, 'fixes_search_entry') or not self.fixes_search_entry.winfo_exists():
             return
         
         search_text = self.fixes_search_entry.get().lower()
         
-        # Don't filter if it's just the placeholder text
+        # The placeholder text shows every fix, like an empty search
         if search_text == "search fixes...":
-            self._restore_all_fixes()
-            return
-        
-        # Hide all cards first
-        for frame in self.all_rec_frames:
-            frame.grid_remove()
-        
-        # Track which categories have visible items
-        visible_categories = set()
+            search_text = ""
         
-        # Filter all recommendation frames and track visible categories
-        visible_frames_by_category = {}
+        # Arrow keys, modifiers and focus changes leave the query as it was
+        if search_text == self._fix_filter_state[0]:
+            return
         
-        for frame in self.all_rec_frames:
-            if hasattr(frame, '_rec_data') and hasattr(frame, '_operation_type'):
-                rec = frame._rec_data
-                operation_type = frame._operation_type
-                
-                # Search in filename, action type, target files, and cleanup files
-                searchable_text = f"{rec['from']} {rec['action']}"
-                if 'to' in rec:
-                    if isinstance(rec['to'], list):
-                        searchable_text += " " + " ".join(rec['to'])
-                    else:
-                        searchable_text += " " + str(rec['to'])
-                if rec.get('action') == 'cleanup' and rec.get('cleanup_files'):
-                    searchable_text += " " + " ".join(rec['cleanup_files'])
-                
-                if search_text in searchable_text.lower():
-                    if operation_type not in visible_frames_by_category:
-                        visible_frames_by_category[operation_type] = []
-                    visible_frames_by_category[operation_type].append(frame)
-                    visible_categories.add(operation_type)
-        
-        # Sort frames within each category by dex number and show them
-        for operation_type, frames in visible_frames_by_category.items():
-            # Sort frames by dex number (lowest first)
-            def get_dex_number(frame):
-                if hasattr(frame, '_rec_data'):
-                    filename = frame._rec_data.get('from')
-                    if not filename:
-                        return 9999
-                    # Handle both single files and lists of files
-                    if isinstance(filename, list):
-                        filename = filename[0]  # Use first file for sorting
-                    match = re.match(r'^(\d{3,4})', filename)
-                    return int(match.group(1)) if match else 9999
-                return 9999
-            
-            frames.sort(key=get_dex_number)
-            
-            # Show frames in proper order
-            for frame in frames:
-                frame.grid()
-        
-        # Group sections and grid containers by operation type
-        section_groups = {}
-        grid_groups = {}
-        
-        for section_frame in self.all_section_frames:
-            if hasattr(section_frame, '_operation_section_header'):
-                op_type = section_frame._operation_section_header
-                section_groups[op_type] = section_frame
-        
-        for grid_container in self.all_grid_containers:
-            if hasattr(grid_container, '_operation_type'):
-                op_type = grid_container._operation_type
-                grid_groups[op_type] = grid_container
-        
-        # Sort visible categories by count (least issues first) - same logic as original creation
-        def get_operation_count(op_type):
-            # Count how many recommendations this operation type has
-            count = 0
-            for frame in self.all_rec_frames:
-                if hasattr(frame, '_operation_type') and frame._operation_type == op_type:
-                    count += 1
-            return count
-        
-        # Only sort the visible categories, but maintain the count-based ordering
-        visible_sorted_categories = sorted(visible_categories, key=get_operation_count)
-        
-        # Hide all sections and grid containers first
-        for section_frame in self.all_section_frames:
-            section_frame.pack_forget()
-        for grid_container in self.all_grid_containers:
-            grid_container.pack_forget()
-        
-        # Show visible categories in proper order (least to most operations)
-        for operation_type in visible_sorted_categories:
-            if operation_type in section_groups:
-                section_groups[operation_type].pack(fill=tk.X, padx=10, pady=(10, 3))
-            if operation_type in grid_groups:
-                grid_groups[operation_type].pack(fill=tk.X, padx=10, pady=5)
-    
-    def _restore_all_fixes(self):
-        """Restore all fixes to their original state"""
-        # Group sections by operation type to maintain sorted order
-        section_groups = {}
-        grid_groups = {}
-        
-        for section_frame in self.all_section_frames:
-            if hasattr(section_frame, '_operation_section_header'):
-                op_type = section_frame._operation_section_header
-                section_groups[op_type] = section_frame
-        
-        for grid_container in self.all_grid_containers:
-            if hasattr(grid_container, '_operation_type'):
-                op_type = grid_container._operation_type
-                grid_groups[op_type] = grid_container
-        
-        # Sort operation types by count (least issues first) - same logic as original creation
-        def get_operation_count(op_type):
-            # Count how many recommendations this operation type has
-            count = 0
-            for frame in self.all_rec_frames:
-                if hasattr(frame, '_operation_type') and frame._operation_type == op_type:
-                    count += 1
-            return count
-        
-        sorted_operations = sorted(section_groups.keys(), key=get_operation_count)
-        
-        # Show sections and grid containers in proper order
-        for operation_type in sorted_operations:
-            if operation_type in section_groups:
-                section_groups[operation_type].pack(fill=tk.X, padx=10, pady=(10, 3))
-            if operation_type in grid_groups:
-                grid_groups[operation_type].pack(fill=tk.X, padx=10, pady=5)
-        
-        # Group and sort recommendation frames by category and dex number
-        frames_by_category = {}
-        
-        for frame in self.all_rec_frames:
-            if hasattr(frame, '_operation_type'):
-                operation_type = frame._operation_type
-                if operation_type not in frames_by_category:
-                    frames_by_category[operation_type] = []
-                frames_by_category[operation_type].append(frame)
-        
-        # Sort frames within each category by dex number and show them
-        for operation_type, frames in frames_by_category.items():
-            # Sort frames by dex number (lowest first)
-            def get_dex_number(frame):
-                if hasattr(frame, '_rec_data'):
-                    filename = frame._rec_data['from']
-                    match = re.match(r'^(\d{3,4})', filename)
-                    return int(match.group(1)) if match else 9999
-                return 9999
-            
-            frames.sort(key=get_dex_number)
-            
-            # Show frames in proper order
-            for frame in frames:
-                frame.grid()
-    
+        # Typing more of the previous query can only narrow its matches, so only the
+        # rows that matched last time need to be tested again
+        previous_text, previous_visible = self._fix_filter_state
+        narrowing = previous_text in search_text
+        
+        # Only groups whose matches changed are touched, so each keystroke costs Tk calls
+        # proportional to the rows that appear or disappear
+        tree = self._fixes_tree
+        search_texts = self._fix_search_texts
+        group_position = 0
+        visible_by_group = {}
+        for group_iid, rec_iids in self._fix_groups:
+            shown = previous_visible[group_iid]
+            visible = [iid for iid in (shown if narrowing else rec_iids) 
+                       if search_text in search_texts[iid]]
+            visible_by_group[group_iid] = visible
+            
+            if visible != shown:
+                if narrowing:
+                    # Matches keep their dex order, so detaching the dropped rows is enough
+                    kept = set(visible)
+                    tree.detach(*[iid for iid in shown if iid not in kept])
+                else:
+                    # Detach the old rows and re-attach matches in their dex order
+                    if shown:
+                        tree.detach(*shown)
+                    for position, iid in enumerate(visible):
+                        tree.move(iid, group_iid, position)
+            
+            # Attached groups keep their relative order, so only a reappearing group is moved
+            if visible:
+                if not shown:
+                    tree.move(group_iid, '', group_position)
+                group_position += 1
+            elif shown:
+                tree.detach(group_iid)
+        self._fix_filter_state = (search_text, visible_by_group)
     
     def clear_search_placeholder(self, event=None):
         """Clear search placeholder when clicked"""
@@ -6005,17 +5847,34 @@ class SpriteConverterGUI:
             "back_overrides": getattr(self, 'back_overrides', {})
         }
         
-        settings_file = Path("sprite_converter_settings.json")
-        with settings_file.open("w") as f:
-            json.dump(settings, f, indent=2)
+        # Serialize here so the worker writes a consistent snapshot of the settings
+        future = self._settings_io.submit(self._write_settings, json.dumps(settings, indent=2))
+        self.root.after(200, self._report_settings_write, future)
+        return future
+    
+    def _report_settings_write(self, future):
+        """Log a failed settings write once the worker is done (polled on the Tk thread)"""
+        if not future.done():
+            self.root.after(200, self._report_settings_write, future)
+            return
+        error = future.exception()
+        if error is not None:
+            self.log_message(f"Failed to save settings: {error}", "ERROR")
+    
+    @staticmethod
+    def _write_settings(text):
+        """Write serialized settings to disk (runs on the settings I/O worker)"""
+        # Write beside the file and swap it in, so an interrupted save never leaves it truncated
+        temp_file = Path("sprite_converter_settings.json.tmp")
+        temp_file.write_text(text)
+        os.replace(temp_file, "sprite_converter_settings.json")
     
     def load_settings(self):
         """Load saved settings"""
         settings_file = Path("sprite_converter_settings.json")
         if settings_file.exists():
             try:
-                with settings_file.open("r") as f:
-                    settings = json.load(f)
+                settings = json.loads(settings_file.read_text())
                 
                 self.move_dir.set(settings.get("move_dir", ""))
                 self.sprite_dir.set(settings.get("sprite_dir", ""))
@@ -6039,7 +5898,7 @@ class SpriteConverterGUI:
                 self.toggle_log_dir()
                 
                 # Check directories after loading settings with background threading
-                self.root.after(200, self.refresh_analysis)
+                self._schedule_refresh(200)
             except Exception:
                 pass  # Use defaults if loading fails
     
@@ -6083,15 +5942,18 @@ class SpriteConverterGUI:
         # Clean up timers
         self.cleanup_timers()
         
-        # Save settings
-        self.save_settings()
+        # Save settings and wait for the write so it isn't lost on exit
+        future = self.save_settings()
+        self._settings_io.shutdown(wait=True)
+        if future.exception() is not None:
+            print(f"Failed to save settings: {future.exception()}")
         
         # Close window
         self.root.destroy()
     
     def simple_resize_back_frames(self, frames, max_size):
         """Resize back sprite frames using conservative scaling to minimize artifacts."""
-        from PIL import Image, ImageFilter
+        from sprite_processor import pick_resample
         if not frames:
             return frames
         max_width, max_height = max_size
@@ -6103,31 +5965,41 @@ class SpriteConverterGUI:
             new_width = max(1, int(frame_width * scale))
             new_height = max(1, int(frame_height * scale))
             
-            # Use smart resampling: NEAREST for integer scaling, LANCZOS for non-integer
-            scale_x = new_width / frame_width
-            scale_y = new_height / frame_height
-            if scale_x == int(scale_x) and scale_y == int(scale_y) and scale_x >= 1.0 and scale_y >= 1.0:
-                # Integer upscaling - use NEAREST for crisp pixel art
-                resized.append(frame.resize((new_width, new_height), Image.Resampling.NEAREST))
-            else:
-                # Non-integer scaling - use LANCZOS for smoother results
-                resized.append(frame.resize((new_width, new_height), Image.Resampling.LANCZOS))
+            resized.append(frame.resize((new_width, new_height), pick_resample(frame.size, (new_width, new_height))))
         return resized
 
 
 class GUILogHandler(logging.Handler):
     """Custom log handler that sends messages to the GUI"""
     
+    # Records are buffered and written to the log widget at most ~60 times a second
+    FLUSH_INTERVAL_MS = 16
+    
     def __init__(self, gui):
         super().__init__()
         self.gui = gui
+        self._pending = deque()
+        self._flush_lock = threading.Lock()
+        self._flush_scheduled = False
     
     def emit(self, record):
         try:
-            msg = self.format(record)
-            self.gui.root.after(0, lambda: self.gui.log_message(msg))
+            self._pending.append(self.format(record))
+            with self._flush_lock:
+                if self._flush_scheduled:
+                    return
+                self._flush_scheduled = True
+            self.gui.root.after(self.FLUSH_INTERVAL_MS, self._flush)
         except Exception:
-            pass
+            with self._flush_lock:
+                self._flush_scheduled = False
+    
+    def _flush(self):
+        with self._flush_lock:
+            self._flush_scheduled = False
+        pending = self._pending
+        while pending:
+            self.gui.log_message(pending.popleft())
 
 
 
@@ -10,15 +10,25 @@ badges intact. Outputs processed sprites and logs with bounding boxes.
 from __future__ import annotations
 
 import argparse
+import io
 import json
 import logging
+import os
 from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Optional, Tuple
+from typing import Iterable, Iterator, List, Optional, Tuple
 
 from PIL import Image, ImageSequence
 
+try:  # SciPy is optional; without it components are found with the pure-Python flood fill
+    import numpy as np
+    from scipy import ndimage
+except ImportError:
+    np = None
+    ndimage = None
+
 BoundingBox = Tuple[int, int, int, int]  # (left, top, right, bottom) with right/bottom exclusive
 
 
@@ -88,72 +98,110 @@ def load_animated_rgba_frames(path: Path) -> Tuple[List[Image.Image], List[int],
     """Load all frames from an image as RGBA along with timing metadata."""
     with Image.open(path) as img:
         loop = (img.info.get("loop", 0) or 0)
-        default_duration = img.info.get("duration", 100) or 100
-        default_disposal = img.info.get("disposal", 2)
-
         frames: List[Image.Image] = []
         durations: List[int] = []
         disposals: List[int] = []
-
-        for frame in ImageSequence.Iterator(img):
-            duration = frame.info.get("duration", default_duration) or default_duration
+        for frame, duration, disposal in _iter_rgba_frames(img):
+            frames.append(frame)
             durations.append(duration)
-            disposals.append(frame.info.get("disposal", default_disposal))
-            frames.append(frame.convert("RGBA"))
-
-        if not frames:
-            frames.append(img.convert("RGBA"))
-            durations.append(default_duration)
-            disposals.append(default_disposal)
+            disposals.append(disposal)
 
     return frames, durations, loop, disposals
 
 
+def iter_animated_rgba_frames(path: Path) -> Iterator[Tuple[Image.Image, int, int]]:
+    """Yield (frame, duration, disposal) one RGBA frame at a time.
+
+    Use this instead of load_animated_rgba_frames when only a single pass (or only
+    the first few frames) is needed; the file stays open until the generator ends.
+    """
+    with Image.open(path) as img:
+        yield from _iter_rgba_frames(img)
+
+
+def _iter_rgba_frames(img: Image.Image) -> Iterator[Tuple[Image.Image, int, int]]:
+    default_duration = img.info.get("duration", 100) or 100
+    default_disposal = img.info.get("disposal", 2)
+
+    yielded = False
+    for frame in ImageSequence.Iterator(img):
+        duration = frame.info.get("duration", default_duration) or default_duration
+        yield frame.convert("RGBA"), duration, frame.info.get("disposal", default_disposal)
+        yielded = True
+
+    if not yielded:
+        yield img.convert("RGBA"), default_duration, default_disposal
+
 
 def union_frame_bbox(frames: Iterable[Image.Image]) -> Optional[BoundingBox]:
     """Return the union bounding box of non-transparent pixels across frames."""
-    boxes = [frame.getbbox() for frame in frames if frame.getbbox()]
-    if not boxes:
-        return None
+    union: Optional[BoundingBox] = None
+    for frame in frames:
+        # One alpha scan per frame; empty frames have no bbox
+        box = frame.getbbox()
+        if box is None:
+            continue
+        if union is None:
+            union = box
+        else:
+            union = (min(union[0], box[0]), min(union[1], box[1]), max(union[2], box[2]), max(union[3], box[3]))
+    return union
 
-    left = min(box[0] for box in boxes)
-    top = min(box[1] for box in boxes)
-    right = max(box[2] for box in boxes)
-    bottom = max(box[3] for box in boxes)
-    return left, top, right, bottom
 
 
+def pick_resample(source_size: Tuple[int, int], target_size: Tuple[int, int]) -> Image.Resampling:
+    """Use NEAREST for whole-number upscales (crisp pixel art) and LANCZOS otherwise."""
+    old_w, old_h = source_size
+    new_w, new_h = target_size
+    if new_w >= old_w and new_h >= old_h and new_w % old_w == 0 and new_h % old_h == 0:
+        return Image.Resampling.NEAREST
+    return Image.Resampling.LANCZOS
 
-def resize_animation_frames(frames: List[Image.Image], size: Tuple[int, int]) -> List[Image.Image]:
-    """Resize an animated sequence to the target size while keeping alignment."""
-    if size[0] <= 0 or size[1] <= 0:
-        raise ValueError(f"Invalid resize dimensions: {size}")
 
-    content_bbox = union_frame_bbox(frames)
+def resize_frames(frames: Iterable[Image.Image], size: Tuple[int, int], resample: Optional[Image.Resampling] = None) -> List[Image.Image]:
+    """Resize every frame to size, choosing the filter with pick_resample unless one is given.
+
+    The filter is picked once per distinct source size, which for cropped animations
+    means once per call.
+    """
+    resample_by_size = {}
     resized_frames: List[Image.Image] = []
     for frame in frames:
-        working = frame
-        if content_bbox:
-            working = frame.crop(content_bbox)
-        # Use smart resampling: NEAREST for integer scaling, LANCZOS for non-integer
-        scale_x = size[0] / working.width
-        scale_y = size[1] / working.height
-        if scale_x == int(scale_x) and scale_y == int(scale_y) and scale_x >= 1.0 and scale_y >= 1.0:
-            # Integer upscaling - use NEAREST for crisp pixel art
-            resized_frames.append(working.resize(size, Image.Resampling.NEAREST))
-        else:
-            # Non-integer scaling - use LANCZOS for smoother results
-            resized_frames.append(working.resize(size, Image.Resampling.LANCZOS))
+        frame_resample = resample
+        if frame_resample is None:
+            frame_resample = resample_by_size.get(frame.size)
+            if frame_resample is None:
+                frame_resample = resample_by_size[frame.size] = pick_resample(frame.size, size)
+        resized_frames.append(frame.resize(size, frame_resample))
     return resized_frames
 
 
-def resize_animation_frames_preserve_aspect(frames: List[Image.Image], max_size: Tuple[int, int]) -> List[Image.Image]:
-    """Resize an animated sequence to fit well within max_size while preserving aspect ratio."""
+def resize_animation_frames(frames: List[Image.Image], size: Tuple[int, int], content_bbox: Optional[BoundingBox] = None) -> List[Image.Image]:
+    """Resize an animated sequence to the target size while keeping alignment.
+
+    Pass content_bbox when the union bounding box of the frames is already known.
+    """
+    if size[0] <= 0 or size[1] <= 0:
+        raise ValueError(f"Invalid resize dimensions: {size}")
+
+    if content_bbox is None:
+        content_bbox = union_frame_bbox(frames)
+    if content_bbox:
+        frames = [frame.crop(content_bbox) for frame in frames]
+    return resize_frames(frames, size)
+
+
+def resize_animation_frames_preserve_aspect(frames: List[Image.Image], max_size: Tuple[int, int], content_bbox: Optional[BoundingBox] = None) -> List[Image.Image]:
+    """Resize an animated sequence to fit well within max_size while preserving aspect ratio.
+
+    Pass content_bbox when the union bounding box of the frames is already known.
+    """
     if max_size[0] <= 0 or max_size[1] <= 0:
         raise ValueError(f"Invalid max dimensions: {max_size}")
 
     # Get the union bounding box across ALL frames to account for animation movement
-    content_bbox = union_frame_bbox(frames)
+    if content_bbox is None:
+        content_bbox = union_frame_bbox(frames)
     if not content_bbox:
         return frames
     
@@ -164,17 +212,12 @@ def resize_animation_frames_preserve_aspect(frames: List[Image.Image], max_size:
     scale_limit = min(max_width / bbox_width, max_height / bbox_height)
     scale = min(1.0, scale_limit)
 
-    resized_frames: List[Image.Image] = []
-    for frame in frames:
-        working = frame.crop(content_bbox)
-
-        if scale < 1.0:
-            new_width = max(1, int(round(working.size[0] * scale)))
-            new_height = max(1, int(round(working.size[1] * scale)))
-            resized_frames.append(working.resize((new_width, new_height), Image.Resampling.LANCZOS))
-        else:
-            resized_frames.append(working.copy())
-    return resized_frames
+    cropped_frames = [frame.crop(content_bbox) for frame in frames]
+    if scale < 1.0:
+        new_width = max(1, int(round(bbox_width * scale)))
+        new_height = max(1, int(round(bbox_height * scale)))
+        return resize_frames(cropped_frames, (new_width, new_height), Image.Resampling.LANCZOS)
+    return cropped_frames
 
 
 
@@ -197,98 +240,105 @@ def normalize_durations(durations: List[int], frame_count: int, fallback: int =
 
 
 
-def extract_components(alpha: Image.Image) -> List[Component]:
-
-    """Return connected components for the alpha channel using 4-neighbourhood."""
-
-    w, h = alpha.size
-
-    pixels = alpha.load()
-
-    visited = [[False] * w for _ in range(h)]
-
-    components: List[Component] = []
-
-
-
-    for y in range(h):
-
-        for x in range(w):
-
-            if visited[y][x]:
-
-                continue
-
-            visited[y][x] = True
-
-            # Use a higher threshold to filter out very low alpha values (likely artifacts)
-            if pixels[x, y] < 32:  # Only consider pixels with alpha >= 32 (out of 255)
-
-                continue
-
-
-
-            stack = [(x, y)]
-
-            min_x = max_x = x
-
-            min_y = max_y = y
-
-            count = 0
-
-
-
-            while stack:
-
-                cx, cy = stack.pop()
-
-                count += 1
-
-                if cx < min_x:
+# Alpha values below this are treated as transparent (likely artifacts)
+ALPHA_THRESHOLD = 32
 
-                    min_x = cx
+# Maps an alpha byte to 1 if it counts as opaque, for the flood fill fallback
+_OPAQUE_TABLE = bytes(1 if value >= ALPHA_THRESHOLD else 0 for value in range(256))
 
-                if cx > max_x:
+# 4-neighbourhood connectivity for scipy.ndimage.label
+_FOUR_CONNECTED = ((0, 1, 0), (1, 1, 1), (0, 1, 0))
 
-                    max_x = cx
-
-                if cy < min_y:
-
-                    min_y = cy
-
-                if cy > max_y:
-
-                    max_y = cy
-
-
-
-                for nx, ny in ((cx - 1, cy), (cx + 1, cy), (cx, cy - 1), (cx, cy + 1)):
-
-                    if 0 <= nx < w and 0 <= ny < h and not visited[ny][nx]:
-
-                        visited[ny][nx] = True
-
-                        # Use the same threshold for connected components
-                        if pixels[nx, ny] >= 32:
-
-                            stack.append((nx, ny))
 
+def extract_components(alpha: Image.Image) -> List[Component]:
+    """Return connected components for the alpha channel using 4-neighbourhood."""
+    if ndimage is None:
+        return _extract_components_flood_fill(alpha)
 
+    opaque = np.asarray(alpha, dtype=np.uint8) >= ALPHA_THRESHOLD
+    labels, count = ndimage.label(opaque, structure=_FOUR_CONNECTED)
+    if not count:
+        return []
 
-            bbox: BoundingBox = (min_x, min_y, max_x + 1, max_y + 1)
+    # Labels are numbered in scan order, matching the order the flood fill finds components
+    pixel_counts = np.bincount(labels.ravel(), minlength=count + 1)
+    components = [
+        Component(bbox=(cols.start, rows.start, cols.stop, rows.stop), pixel_count=int(pixel_counts[index]))
+        for index, (rows, cols) in enumerate(ndimage.find_objects(labels), start=1)
+    ]
+    components.sort(key=lambda comp: comp.pixel_count, reverse=True)
+    return components
 
-            components.append(Component(bbox=bbox, pixel_count=count))
 
+def _extract_components_flood_fill(alpha: Image.Image) -> List[Component]:
+    """Pure-Python fallback for extract_components when SciPy is not installed."""
+    if alpha.mode != "L":
+        alpha = alpha.convert("L")
+    w, h = alpha.size
 
+    # Flat byte buffers are much cheaper to index than PixelAccess and nested lists;
+    # 1 marks an opaque pixel that has not been assigned to a component yet
+    pending = bytearray(alpha.tobytes().translate(_OPAQUE_TABLE))
+    components: List[Component] = []
+    last_x = w - 1
+    last_y = h - 1
+
+    start = pending.find(1)
+    while start != -1:
+        pending[start] = 0
+        stack = [start]
+        # Bound once per component; these run for every opaque pixel
+        push = stack.append
+        pop = stack.pop
+        min_y, min_x = divmod(start, w)
+        max_x, max_y = min_x, min_y
+        count = 0
+
+        while stack:
+            index = pop()
+            count += 1
+            y, x = divmod(index, w)
+            if x < min_x:
+                min_x = x
+            if x > max_x:
+                max_x = x
+            if y < min_y:
+                min_y = y
+            if y > max_y:
+                max_y = y
+
+            if x > 0 and pending[index - 1]:
+                pending[index - 1] = 0
+                push(index - 1)
+            if x < last_x and pending[index + 1]:
+                pending[index + 1] = 0
+                push(index + 1)
+            if y > 0 and pending[index - w]:
+                pending[index - w] = 0
+                push(index - w)
+            if y < last_y and pending[index + w]:
+                pending[index + w] = 0
+                push(index + w)
+
+        bbox: BoundingBox = (min_x, min_y, max_x + 1, max_y + 1)
+        components.append(Component(bbox=bbox, pixel_count=count))
+        # Components are still discovered in scan order of their first pixel
+        start = pending.find(1, start + 1)
 
     components.sort(key=lambda comp: comp.pixel_count, reverse=True)
-
     return components
 
 
 
 
 
+def _bbox_overlap_area(a: BoundingBox, b: BoundingBox) -> int:
+    """Area shared by two (left, top, right, bottom) boxes; 0 when they do not intersect."""
+    if a[2] <= b[0] or a[0] >= b[2] or a[3] <= b[1] or a[1] >= b[3]:
+        return 0
+    return (min(a[2], b[2]) - max(a[0], b[0])) * (min(a[3], b[3]) - max(a[1], b[1]))
+
+
 def classify_components(components: Iterable[Component], min_pixel_threshold: int = 100) -> Tuple[Optional[Component], List[Component]]:
 
     """Return the largest component as the main sprite; only small, corner-positioned components as badges.
@@ -329,30 +379,26 @@ def classify_components(components: Iterable[Component], min_pixel_threshold: in
     
     potential_badges = valid_comps[1:]  # All components except the main one
     badges = []
+    main_pixels = main.pixel_count
+    main_bbox = main.bbox
     
     for comp in potential_badges:
-        # Size check: must be smaller than main sprite, but not too restrictive
-        size_ratio = comp.pixel_count / main.pixel_count
-        if size_ratio > 0.40:  # Skip components larger than 40% of main sprite (was 15%)
-            continue
-            
         # Absolute size check: filter out very large background effects
         if comp.pixel_count > 2000:  # Skip very large components (was 800)
             continue
             
-        # Position check: skip components that heavily overlap with main sprite
-        comp_left, comp_top, comp_right, comp_bottom = comp.bbox
-        main_left, main_top, main_right, main_bottom = main.bbox
-        
-        # Check if component overlaps significantly with main sprite (likely part of the Pokemon)
-        overlap_x = max(0, min(comp_right, main_right) - max(comp_left, main_left))
-        overlap_y = max(0, min(comp_bottom, main_bottom) - max(comp_top, main_top))
-        overlap_area = overlap_x * overlap_y
-        comp_area = (comp_right - comp_left) * (comp_bottom - comp_top)
-        
-        if overlap_area > comp_area * 0.5:  # Skip if more than 50% overlap with main sprite (was 30%)
+        # Size check: must be smaller than main sprite, but not too restrictive
+        if comp.pixel_count / main_pixels > 0.40:  # Skip components larger than 40% of main sprite (was 15%)
             continue
             
+        # Position check: skip components that heavily overlap with main sprite (likely part of the Pokemon)
+        overlap_area = _bbox_overlap_area(comp.bbox, main_bbox)
+        if overlap_area:
+            comp_left, comp_top, comp_right, comp_bottom = comp.bbox
+            comp_area = (comp_right - comp_left) * (comp_bottom - comp_top)
+            if overlap_area > comp_area * 0.5:  # Skip if more than 50% overlap with main sprite (was 30%)
+                continue
+            
         # If it passes all checks, it's likely a real badge
         badges.append(comp)
 
@@ -368,7 +414,7 @@ def crop_to_content(image: Image.Image) -> Image.Image:
 
     """Crop the image to the bounding box of non-transparent pixels."""
 
-    alpha = image.split()[3]
+    alpha = image.getchannel("A")
 
     bbox = alpha.getbbox()
 
@@ -456,15 +502,7 @@ def resize_sprite(sprite: Image.Image, size: Tuple[int, int]) -> Image.Image:
 
     cropped = crop_to_content(sprite)
 
-    # Use smart resampling: NEAREST for integer scaling, LANCZOS for non-integer
-    scale_x = size[0] / cropped.width
-    scale_y = size[1] / cropped.height
-    if scale_x == int(scale_x) and scale_y == int(scale_y) and scale_x >= 1.0 and scale_y >= 1.0:
-        # Integer upscaling - use NEAREST for crisp pixel art
-        return cropped.resize(size, Image.Resampling.NEAREST)
-    else:
-        # Non-integer scaling - use LANCZOS for smoother results
-        return cropped.resize(size, Image.Resampling.LANCZOS)
+    return cropped.resize(size, pick_resample(cropped.size, size))
 
 
 
@@ -482,15 +520,7 @@ def paste_sprite(base: Image.Image, sprite: Image.Image, bbox: BoundingBox) -> I
 
     if sprite.size != (width, height):
 
-        # Use smart resampling: NEAREST for integer scaling, LANCZOS for non-integer
-        scale_x = width / sprite.width
-        scale_y = height / sprite.height
-        if scale_x == int(scale_x) and scale_y == int(scale_y) and scale_x >= 1.0 and scale_y >= 1.0:
-            # Integer upscaling - use NEAREST for crisp pixel art
-            sprite = sprite.resize((width, height), Image.Resampling.NEAREST)
-        else:
-            # Non-integer scaling - use LANCZOS for smoother results
-            sprite = sprite.resize((width, height), Image.Resampling.LANCZOS)
+        sprite = sprite.resize((width, height), pick_resample(sprite.size, (width, height)))
 
     result = base.copy()
 
@@ -504,13 +534,16 @@ def paste_sprite(base: Image.Image, sprite: Image.Image, bbox: BoundingBox) -> I
 
 def process_pair(move_img_path: Path, sprite_path: Path, output_dir: Path, logger: logging.Logger) -> Optional[dict]:
     """Process a single pair of sprites."""
-    base_frames, _, _, _ = load_animated_rgba_frames(move_img_path)
-    if not base_frames:
+    # Only the first base frame is inspected, so stop decoding after it
+    base_frames = iter_animated_rgba_frames(move_img_path)
+    first = next(base_frames, None)
+    base_frames.close()
+    if first is None:
         logger.warning("%s: unable to read base sprite frames", move_img_path.name)
         return None
 
-    base_frame = base_frames[0]
-    components = extract_components(base_frame.split()[3])
+    base_frame = first[0]
+    components = extract_components(base_frame.getchannel("A"))
     main_component, badge_components = classify_components(components)
 
     if main_component is None:
@@ -560,15 +593,20 @@ def process_pair(move_img_path: Path, sprite_path: Path, output_dir: Path, logge
         logger.info("%s: replacement sprite larger than bullseye (%.2fx), scaling canvas by %.2fx", 
                    move_img_path.name, scale_factor, scale_factor)
     
-    # Calculate new canvas dimensions based on scale factor
-    new_canvas_width = int(base_frame.width * scale_factor)
-    new_canvas_height = int(base_frame.height * scale_factor)
-    
-    # Calculate new bbox position and size in the scaled canvas
-    new_bbox_left = int(bbox[0] * scale_factor)
-    new_bbox_top = int(bbox[1] * scale_factor)
-    new_bbox_right = int(bbox[2] * scale_factor)
-    new_bbox_bottom = int(bbox[3] * scale_factor)
+    if scale_factor != 1.0:
+        # Calculate new canvas dimensions based on scale factor
+        new_canvas_width = int(base_frame.width * scale_factor)
+        new_canvas_height = int(base_frame.height * scale_factor)
+        
+        # Calculate new bbox position and size in the scaled canvas
+        new_bbox_left = int(bbox[0] * scale_factor)
+        new_bbox_top = int(bbox[1] * scale_factor)
+        new_bbox_right = int(bbox[2] * scale_factor)
+        new_bbox_bottom = int(bbox[3] * scale_factor)
+    else:
+        # Replacement fits inside the bullseye bbox: keep the original geometry
+        new_canvas_width, new_canvas_height = base_frame.size
+        new_bbox_left, new_bbox_top, new_bbox_right, new_bbox_bottom = bbox
     new_bbox_width = new_bbox_right - new_bbox_left
     new_bbox_height = new_bbox_bottom - new_bbox_top
     
@@ -591,9 +629,6 @@ def process_pair(move_img_path: Path, sprite_path: Path, output_dir: Path, logge
     canvas_width = new_canvas_width + scaled_required_shift
     canvas_height = new_canvas_height
 
-    # Create a completely clean base - no badges yet, they'll be added in the composition loop
-    base_clean = Image.new('RGBA', (new_canvas_width, new_canvas_height), (0, 0, 0, 0))
-
     # Prepare badge layers for the final composition
     # Type indicators stay at their original size and are positioned relative to the scaled canvas
     badge_layers = []
@@ -630,13 +665,16 @@ def process_pair(move_img_path: Path, sprite_path: Path, output_dir: Path, logge
             final_badge_top + (original_badge_bottom - original_badge_top),
         ])
 
-    base_canvas = Image.new("RGBA", (canvas_width, canvas_height))
-    base_canvas.paste(base_clean, (0, 0))
+    # A completely clean, transparent base - badges are composited onto it below
+    base_canvas = Image.new("RGBA", (canvas_width, canvas_height), (0, 0, 0, 0))
+
+    # Badges are identical on every frame, so composite them once up front
+    base_with_badges = base_canvas.copy()
+    for badge_img, badge_left, badge_top in badge_layers:
+        base_with_badges.paste(badge_img, (badge_left, badge_top), badge_img)
 
     output_frames: List[Image.Image] = []
     for i, cropped_frame in enumerate(cropped_replacement_frames):
-        canvas = base_canvas.copy()
-        
         # Position the cropped replacement frame in the scaled canvas
         # Center horizontally around the scaled bbox center, align to bottom vertically
         frame_width, frame_height = cropped_frame.size
@@ -652,12 +690,22 @@ def process_pair(move_img_path: Path, sprite_path: Path, output_dir: Path, logge
         paste_x = max(0, min(paste_x, canvas_width - frame_width))
         paste_y = max(0, min(paste_y, canvas_height - frame_height))
         
+        # Badges must stay on top of the sprite; if one overlaps this frame's sprite,
+        # composite in the original order instead of starting from the pre-badged canvas
+        overlaps_badge = any(
+            badge_left < paste_x + frame_width and paste_x < badge_left + badge_img.width
+            and badge_top < paste_y + frame_height and paste_y < badge_top + badge_img.height
+            for badge_img, badge_left, badge_top in badge_layers
+        )
+        canvas = (base_canvas if overlaps_badge else base_with_badges).copy()
+        
         # Use the cropped frame as both image and mask for cleaner pasting
         canvas.paste(cropped_frame, (paste_x, paste_y), cropped_frame)
         
         # Add type indicators at their scaled positions
-        for badge_img, badge_left, badge_top in badge_layers:
-            canvas.paste(badge_img, (badge_left, badge_top), badge_img)
+        if overlaps_badge:
+            for badge_img, badge_left, badge_top in badge_layers:
+                canvas.paste(badge_img, (badge_left, badge_top), badge_img)
         
         output_frames.append(canvas)
 
@@ -667,14 +715,18 @@ def process_pair(move_img_path: Path, sprite_path: Path, output_dir: Path, logge
     output_dir.mkdir(parents=True, exist_ok=True)
     output_path = output_dir / move_img_path.name
 
+    # Encode in memory and write the file in one go rather than many small writes
+    buffer = io.BytesIO()
     output_frames[0].save(
-        output_path,
+        buffer,
+        format=Image.registered_extensions()[output_path.suffix.lower()],
         save_all=True,
         append_images=output_frames[1:],
         loop=loop,
         duration=durations,
         disposal=2,
     )
+    output_path.write_bytes(buffer.getvalue())
 
     logger.info(
         "%s: composited animated sprite (scale=%.2fx, bbox=%s, shift=%s) using %s -> %s",
@@ -697,7 +749,40 @@ def process_pair(move_img_path: Path, sprite_path: Path, output_dir: Path, logge
 
 
 
-def run_pipeline(move_dir: Path, sprite_dir: Path, output_dir: Path, log_dir: Path, limit: Optional[int] = None) -> None:
+class _RecordCollector(logging.Handler):
+    """Keep log records so a worker process can hand them back to the parent's logger."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: List[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Render the message and traceback now: args and exc_info may not pickle
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        self.records.append(record)
+
+
+def _process_pair_worker(move_path: Path, sprite_path: Path, output_dir: Path) -> Tuple[Optional[dict], List[logging.LogRecord]]:
+    """Run process_pair in a worker process, returning its result and log records."""
+    collector = _RecordCollector()
+    logger = logging.getLogger("sprite_processor.worker")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    logger.handlers[:] = [collector]
+    try:
+        result = process_pair(move_path, sprite_path, output_dir, logger)
+    except Exception as exc:  # pylint: disable=broad-except
+        logger.exception("%s: failed to process pair due to %s", move_path.name, exc)
+        result = None
+    return result, collector.records
+
+
+
+def run_pipeline(move_dir: Path, sprite_dir: Path, output_dir: Path, log_dir: Path, limit: Optional[int] = None, workers: Optional[int] = None) -> None:
 
     logger = configure_logging(log_dir)
 
@@ -715,21 +800,55 @@ def run_pipeline(move_dir: Path, sprite_dir: Path, output_dir: Path, log_dir: Pa
 
 
 
-    for move_path in move_paths:
+    workers = min(workers or os.cpu_count() or 1, len(move_paths))
+
+    if workers <= 1:
 
-        sprite_path = sprite_dir / move_path.name
+        # Not worth starting worker processes for a single sprite or a single core
 
-        try:
+        for move_path in move_paths:
 
-            result = process_pair(move_path, sprite_path, output_dir, logger)
+            sprite_path = sprite_dir / move_path.name
 
-            if result:
+            try:
 
-                results[move_path.name] = result
+                result = process_pair(move_path, sprite_path, output_dir, logger)
 
-        except Exception as exc:  # pylint: disable=broad-except
+                if result:
 
-            logger.exception("%s: failed to process pair due to %s", move_path.name, exc)
+                    results[move_path.name] = result
+
+            except Exception as exc:  # pylint: disable=broad-except
+
+                logger.exception("%s: failed to process pair due to %s", move_path.name, exc)
+
+    else:
+
+        # Pairs are independent, so each one runs in its own process; results and logs are
+
+        # collected in input order so the summary and log read the same as a serial run
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+
+            futures = [
+
+                (move_path, executor.submit(_process_pair_worker, move_path, sprite_dir / move_path.name, output_dir))
+
+                for move_path in move_paths
+
+            ]
+
+            for move_path, future in futures:
+
+                result, records = future.result()
+
+                for record in records:
+
+                    logger.handle(record)
+
+                if result:
+
+                    results[move_path.name] = result
 
 
 
@@ -761,6 +880,8 @@ def parse_args(argv: Optional[Iterable[str]] = None) -> argparse.Namespace:
 
     parser.add_argument("--limit", type=int, default=None, help="Optionally limit number of sprites processed")
 
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes (defaults to the CPU count; 1 processes serially)")
+
     return parser.parse_args(argv)
 
 
@@ -771,7 +892,7 @@ def main() -> None:
 
     args = parse_args()
 
-    run_pipeline(args.move_dir, args.sprite_dir, args.output_dir, args.log_dir, args.limit)
+    run_pipeline(args.move_dir, args.sprite_dir, args.output_dir, args.log_dir, args.limit, args.workers)
 
 
 